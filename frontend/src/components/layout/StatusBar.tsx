@@ -20,8 +20,8 @@ export function StatusBar({ wsConnected = false }: StatusBarProps) {
         {/* Node count */}
         {stats && (
           <>
-            <span>Nodes: <span className="text-slate-200">{stats.totalNodes}</span></span>
-            <span>Edges: <span className="text-slate-200">{stats.totalLinks}</span></span>
+            <span data-testid="node-count">Nodes: <span className="text-slate-200">{stats.totalNodes}</span></span>
+            <span data-testid="edge-count">Edges: <span className="text-slate-200">{stats.totalLinks}</span></span>
           </>
         )}
         
@@ -44,7 +44,7 @@ export function StatusBar({ wsConnected = false }: StatusBarProps) {
         {/* WebSocket status */}
         <span className="flex items-center gap-1">
           WebSocket: 
-          <span className={wsConnected ? 'text-green-400' : 'text-slate-500'}>
+          <span data-testid="connection-status" className={wsConnected ? 'text-green-400' : 'text-slate-500'}>
             {wsConnected ? '● Connected' : '○ Disconnected'}
           </span>
         </span>
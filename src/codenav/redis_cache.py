@@ -285,15 +285,17 @@ class RedisCacheBackend:
         try:
             info = await self.redis.info()
             
-            # Count keys by type
+            # Count keys incrementally: KEYS would block the server for every client
             pattern = f"{self.config.prefix}:*"
-            keys = await self.redis.keys(pattern)
+            total_keys = 0
+            async for _ in self.redis.scan_iter(match=pattern, count=1000):
+                total_keys += 1
             
             stats = {
                 "status": "connected",
                 "redis_version": info.get("redis_version"),
                 "used_memory": info.get("used_memory_human"),
-                "total_keys": len(keys),
+                "total_keys": total_keys,
                 "memory_usage": info.get("used_memory"),
                 "keyspace_hits": info.get("keyspace_hits", 0),
                 "keyspace_misses": info.get("keyspace_misses", 0),
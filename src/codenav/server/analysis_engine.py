@@ -42,6 +42,8 @@ class UniversalAnalysisEngine:
         self.graph = self.parser.graph
         self._is_analyzed = False
         self._last_analysis_time = 0
+        # Bumped whenever the graph contents change, so callers can key caches on it
+        self.graph_revision = 0
 
         # File watcher for automatic updates
         self._file_watcher: Optional[DebouncedFileWatcher] = None
@@ -145,6 +147,7 @@ class UniversalAnalysisEngine:
                         )
                         self.graph.mark_file_processed(file_path)
 
+                self.graph_revision += 1
                 logger.info("Incremental update completed successfully")
 
             except Exception as e:
@@ -219,6 +222,7 @@ class UniversalAnalysisEngine:
                     )
                     self._is_analyzed = True
                     self._last_analysis_time = time.time()
+                    self.graph_revision += 1
                     logger.info("Analysis completed successfully")
 
                     # Start file watcher after first successful analysis
@@ -230,6 +234,11 @@ class UniversalAnalysisEngine:
             else:
                 logger.debug("Using cached analysis results")
 
+    async def refresh_graph(self) -> int:
+        """Re-analyze if source files changed since the last analysis; return graph_revision."""
+        await self._ensure_analyzed()
+        return self.graph_revision
+
     async def force_reanalysis(self):
         """Force a complete re-analysis, clearing all caches."""
         logger.info("Forcing complete re-analysis...")
@@ -266,7 +275,7 @@ class UniversalAnalysisEngine:
             "total_relationships": stats.get("total_relationships", 0),
             "node_types": stats.get("node_types", {}),
             "languages": stats.get("languages", {}),
-            "last_analysis": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "last_analysis": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self._last_analysis_time)),
             "project_root": str(self.project_root),
             "file_watcher": self.get_file_watcher_stats(),
         }
@@ -423,13 +432,15 @@ class UniversalAnalysisEngine:
         # Convert the complexity analysis to the expected format
         for item in complexity_data.get("high_complexity_functions", []):
             risk_level = "high" if item["complexity"] > 20 else "moderate" if item["complexity"] > 10 else "low"
+            # The analyzer reports where a function lives as a single "path:line" string
+            file_path, _, line = item["location"].rpartition(":")
             results.append({
                 "name": item["name"],
                 "type": item.get("type", "function"),
                 "complexity": item["complexity"],
                 "risk_level": risk_level,
-                "file": item["file"],
-                "line": item["line"],
+                "file": file_path,
+                "line": int(line),
             })
 
         return results
@@ -5,59 +5,159 @@ Model Context Protocol server with tool handlers and CLI interface.
 """
 
 import asyncio
+import contextlib
+import io
 import logging
+import operator
+import os
+import signal
+import textwrap
+from collections.abc import Awaitable, Callable, Mapping
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, List, Optional
 
-import anyio
 import click
 import mcp.types as types
 from mcp.server.lowlevel import Server
 from mcp.server.stdio import stdio_server
 
+from ..redis_cache import RedisConfig
 from .analysis_engine import UniversalAnalysisEngine
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
+def _configure_logging() -> None:
+    """Configure root logging for CLI entry points, unless the host already did."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+
+
 # Global analysis engine
 analysis_engine: Optional[UniversalAnalysisEngine] = None
+# Serializes engine construction so concurrent tool calls share one instance
+_engine_lock = asyncio.Lock()
+# Shared default Redis settings, used when no explicit URL is given
+_DEFAULT_REDIS_CONFIG = RedisConfig()
+# Engine query results keyed by name, valid while the engine's graph_revision is unchanged
+_stats_cache: Dict[str, tuple[UniversalAnalysisEngine, int, Any]] = {}
 
 
 async def ensure_analysis_engine_ready(project_root: Path, redis_url: Optional[str] = None, enable_redis_cache: bool = True) -> UniversalAnalysisEngine:
     """Ensure the analysis engine is initialized and ready."""
     global analysis_engine
-    if analysis_engine is None:
-        # Set up Redis config if provided
-        redis_config = None
-        if enable_redis_cache:
-            from ..redis_cache import RedisConfig
-            redis_config = RedisConfig(url=redis_url) if redis_url else RedisConfig()
-        
-        analysis_engine = UniversalAnalysisEngine(
-            project_root, 
-            redis_config=redis_config, 
-            enable_redis_cache=enable_redis_cache
-        )
+    if analysis_engine is not None:
+        return analysis_engine
+
+    async with _engine_lock:
+        # Re-check: another coroutine may have built the engine while we waited
+        if analysis_engine is None:
+            # Set up Redis config if provided
+            redis_config = None
+            if enable_redis_cache:
+                redis_config = RedisConfig(url=redis_url) if redis_url else _DEFAULT_REDIS_CONFIG
+
+            analysis_engine = UniversalAnalysisEngine(
+                project_root,
+                redis_config=redis_config,
+                enable_redis_cache=enable_redis_cache
+            )
     return analysis_engine
 
 
+def _event_loop_factory():
+    """Return uvloop's event loop factory when uvloop is installed, else None (stdlib loop)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 async def cleanup_analysis_engine():
     """Clean up the global analysis engine."""
     global analysis_engine
+    _stats_cache.clear()
     if analysis_engine is not None:
         await analysis_engine.cleanup()
         analysis_engine = None
 
 
-# Tool handlers
-async def handle_get_usage_guide(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
-    """Handle usage guide requests."""
-    guide_content = """
+async def _cached_engine_query(
+    engine: UniversalAnalysisEngine, revision: int, key: str, query: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Return a cached engine query result, re-running it only when the graph has changed.
+
+    revision comes from one engine.refresh_graph() per handler call, so source edits
+    are picked up even with the file watcher off, without re-scanning per lookup.
+    """
+    cached = _stats_cache.get(key)
+    if cached is not None and cached[0] is engine and cached[1] == revision:
+        return cached[2]
+
+    value = await query()
+    # Read the revision after awaiting: the query itself may have (re)built the graph
+    _stats_cache[key] = (engine, engine.graph_revision, value)
+    return value
+
+
+# Report size caps; rows beyond these are summarized in a trailing footer
+_DEFAULT_RESULT_LIMIT = 500
+_DEFAULT_COMPLEXITY_LIMIT = 100
+
+
+def _row_limit(arguments: dict, default: int) -> int:
+    """Read the optional limit argument, clamped to at least one row."""
+    return max(1, int(arguments.get("limit", default)))
+
+
+# Per-row report templates, filled with str.format_map from the engine result dicts
+_REFERENCE_ROW = "- **{referencing_symbol}**\n  - File: `{basename}:{line}`\n  - Context: {context}\n  - Full Path: `{file}`\n\n"
+_CALLER_ROW = "- **{caller}** ({caller_type})\n  - File: `{basename}:{line}`\n  - Full Path: `{file}`\n\n"
+# Fetches every field a complexity_analysis row needs in a single call
+_complexity_fields = operator.itemgetter("name", "type", "complexity", "risk_level", "file", "line")
+
+
+# Static skeleton of the project_statistics report; dynamic sections are pre-joined strings
+_PROJECT_STATS_TEMPLATE = textwrap.dedent("""\
+    # Advanced Project Statistics (Powered by rustworkx)
+
+    ## Overview
+    - **Project Root**: `{project_root}`
+    - **Files Analyzed**: {total_files}
+    - **Total Code Elements**: {total_nodes:,}
+    - **Relationships**: {total_relationships:,}
+    - **Last Analysis**: {last_analysis}
+
+    ## Code Structure
+    {node_types}
+    ## Graph Analytics
+    - **Graph Density**: {density:.4f}
+    - **Average Degree**: {average_degree:.2f}
+    - **Is DAG**: {is_dag}
+    - **Circular Dependencies**: {num_cycles}
+
+    ## Critical Structural Elements
+    {critical}
+    ## Most Central Code Elements (Betweenness)
+    {betweenness}
+    ## Most Influential Code Elements (PageRank)
+    {pagerank}""")
+
+
+def _format_ranked_nodes(nodes: List[Dict[str, Any]], top: int = 5) -> str:
+    """Render the top-ranked centrality entries as a numbered markdown list."""
+    return "".join(
+        f"{i}. **{node['node_name']}** ({node['node_type']}) - {node['score']:.4f}\n"
+        for i, node in enumerate(nodes[:top], 1)
+    )
+
+
+# Static usage guide, built once at import and shared across calls
+_USAGE_GUIDE_CONTENT = """
 # 📚 Code Graph Intelligence - Tool Usage Guide
 
 ## 🚀 Quick Start Workflow
@@ -178,13 +278,30 @@ analyze_codebase → dependency_analysis → project_statistics → complexity_a
 **Remember: Quality analysis is iterative - start broad, then drill down into specific areas of interest!**
 """
 
-    return [types.TextContent(type="text", text=guide_content)]
+
+def _text(content: str) -> list[types.TextContent]:
+    """Wrap trusted, server-generated text as a tool response without pydantic validation."""
+    return [types.TextContent.model_construct(type="text", text=content)]
+
+
+# Tool handlers
+async def handle_get_usage_guide(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
+    """Handle usage guide requests."""
+    return _text(_USAGE_GUIDE_CONTENT)
 
 
 async def handle_analyze_codebase(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
     """Handle analyze_codebase tool."""
-    stats = await engine.get_project_stats()
-    result = f"""# Comprehensive Codebase Analysis
+    if arguments.get("rebuild_graph", False):
+        # Bumps graph_revision, which invalidates the cached report below
+        await engine.force_reanalysis()
+        revision = engine.graph_revision
+    else:
+        revision = await engine.refresh_graph()
+
+    async def build_report() -> str:
+        stats = await _cached_engine_query(engine, revision, "project_stats", engine.get_project_stats)
+        return f"""# Comprehensive Codebase Analysis
 
 ## Project Overview
 - **Root Directory**: `{stats["project_root"]}`
@@ -204,7 +321,9 @@ async def handle_analyze_codebase(engine: UniversalAnalysisEngine, arguments: di
 
 ✅ **Analysis Complete** - {stats["total_nodes"]} nodes analyzed across {stats["total_files"]} files"""
 
-    return [types.TextContent(type="text", text=result)]
+    # Source edits were detected above, so only an unchanged graph reuses the report
+    result = await _cached_engine_query(engine, revision, "analyze_codebase_report", build_report)
+    return _text(result)
 
 
 async def handle_find_definition(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
@@ -218,74 +337,90 @@ async def handle_find_definition(engine: UniversalAnalysisEngine, arguments: dic
         result = f"# Definition Analysis: `{symbol}`\n\n"
         for i, defn in enumerate(definitions, 1):
             result += f"## Definition {i}: {defn['type'].title()}\n"
-            result += f"- **Location**: `{Path(defn['file']).name}:{defn['line']}`\n"
+            result += f"- **Location**: `{os.path.basename(defn['file'])}:{defn['line']}`\n"
             result += f"- **Type**: {defn['type']}\n"
             result += f"- **Complexity**: {defn['complexity']}\n"
             if defn['documentation']:
                 result += f"- **Documentation**: {defn['documentation'][:100]}...\n"
             result += f"- **Full Path**: `{defn['full_path']}`\n\n"
 
-    return [types.TextContent(type="text", text=result)]
+    return _text(result)
 
 
 async def handle_complexity_analysis(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
     """Handle complexity_analysis tool."""
     threshold = arguments.get("threshold", 10)
+    limit = _row_limit(arguments, _DEFAULT_COMPLEXITY_LIMIT)
     complex_functions = await engine.analyze_complexity(threshold)
 
     result = f"# Complexity Analysis (Threshold: {threshold})\n\n"
     result += f"Found **{len(complex_functions)}** functions requiring attention:\n\n"
 
-    for func in complex_functions:
-        risk_emoji = "🔴" if func["risk_level"] == "high" else "🟡"
-        result += f"{risk_emoji} **{func['name']}** ({func['type']})\n"
-        result += f"- **Complexity**: {func['complexity']}\n"
-        result += f"- **Risk Level**: {func['risk_level']}\n"
-        result += f"- **Location**: `{Path(func['file']).name}:{func['line']}`\n\n"
+    for func in complex_functions[:limit]:
+        name, func_type, complexity, risk_level, file_path, line = _complexity_fields(func)
+        risk_emoji = "🔴" if risk_level == "high" else "🟡"
+        result += f"{risk_emoji} **{name}** ({func_type})\n"
+        result += f"- **Complexity**: {complexity}\n"
+        result += f"- **Risk Level**: {risk_level}\n"
+        result += f"- **Location**: `{os.path.basename(file_path)}:{line}`\n\n"
+    if len(complex_functions) > limit:
+        result += f"*... and {len(complex_functions) - limit} more functions*\n"
 
-    return [types.TextContent(type="text", text=result)]
+    return _text(result)
 
 
 async def handle_find_references(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
     """Handle find_references tool."""
     symbol = arguments["symbol"]
+    limit = _row_limit(arguments, _DEFAULT_RESULT_LIMIT)
     references = await engine.find_symbol_references(symbol)
 
     if not references:
         result = f"❌ No references found for symbol: `{symbol}`"
     else:
-        result = f"# Reference Analysis: `{symbol}` ({len(references)} references)\n\n"
+        parts = [f"# Reference Analysis: `{symbol}` ({len(references)} references)\n\n"]
 
-        for ref in references:
-            result += f"- **{ref['referencing_symbol']}**\n"
-            result += f"  - File: `{Path(ref['file']).name}:{ref['line']}`\n"
-            result += f"  - Context: {ref['context']}\n"
-            result += f"  - Full Path: `{ref['file']}`\n\n"
+        basenames: dict[str, str] = {}
+        for ref in references[:limit]:
+            file_name = basenames.get(ref['file'])
+            if file_name is None:
+                file_name = basenames[ref['file']] = os.path.basename(ref['file'])
+            parts.append(_REFERENCE_ROW.format_map({**ref, "basename": file_name}))
+        if len(references) > limit:
+            parts.append(f"*... and {len(references) - limit} more references*\n")
+        result = "".join(parts)
 
-    return [types.TextContent(type="text", text=result)]
+    return _text(result)
 
 
 async def handle_find_callers(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
     """Handle find_callers tool."""
     function = arguments["function"]
+    limit = _row_limit(arguments, _DEFAULT_RESULT_LIMIT)
     callers = await engine.find_function_callers(function)
 
     if not callers:
         result = f"❌ No callers found for function: `{function}`"
     else:
-        result = f"# Caller Analysis: `{function}` ({len(callers)} callers)\n\n"
+        parts = [f"# Caller Analysis: `{function}` ({len(callers)} callers)\n\n"]
 
-        for caller in callers:
-            result += f"- **{caller['caller']}** ({caller['caller_type']})\n"
-            result += f"  - File: `{Path(caller['file']).name}:{caller['line']}`\n"
-            result += f"  - Full Path: `{caller['file']}`\n\n"
+        basenames: dict[str, str] = {}
+        for caller in callers[:limit]:
+            file_name = basenames.get(caller['file'])
+            if file_name is None:
+                file_name = basenames[caller['file']] = os.path.basename(caller['file'])
+            parts.append(_CALLER_ROW.format_map({**caller, "basename": file_name}))
+        if len(callers) > limit:
+            parts.append(f"*... and {len(callers) - limit} more callers*\n")
+        result = "".join(parts)
 
-    return [types.TextContent(type="text", text=result)]
+    return _text(result)
 
 
 async def handle_find_callees(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
     """Handle find_callees tool."""
     function = arguments["function"]
+    limit = _row_limit(arguments, _DEFAULT_RESULT_LIMIT)
     callees = await engine.find_function_callees(function)
 
     if not callees:
@@ -293,209 +428,246 @@ async def handle_find_callees(engine: UniversalAnalysisEngine, arguments: dict)
     else:
         result = f"# Callee Analysis: `{function}` calls {len(callees)} functions\n\n"
 
-        for callee in callees:
+        for callee in callees[:limit]:
             result += f"- **{callee['callee']}**"
             if callee["call_line"]:
                 result += f" (line {callee['call_line']})"
             result += "\n"
+        if len(callees) > limit:
+            result += f"\n*... and {len(callees) - limit} more callees*\n"
 
-    return [types.TextContent(type="text", text=result)]
+    return _text(result)
 
 
 async def handle_dependency_analysis(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
     """Handle dependency_analysis tool with advanced rustworkx analytics."""
     deps = await engine.get_dependency_graph()
 
-    result = "# Advanced Dependency Analysis (Powered by rustworkx)\n\n"
-    result += f"- **Total Files**: {deps['total_files']}\n"
-    result += f"- **Total Dependencies**: {deps['total_dependencies']}\n"
-    result += f"- **Graph Density**: {deps['graph_density']:.4f}\n"
-    result += f"- **Is Directed Acyclic**: {'✅ Yes' if deps['is_directed_acyclic'] else '❌ No'}\n"
-    result += f"- **Strongly Connected Components**: {deps['strongly_connected_components']}\n\n"
+    buf = io.StringIO()
+    buf.write("# Advanced Dependency Analysis (Powered by rustworkx)\n\n")
+    buf.write(f"- **Total Files**: {deps['total_files']}\n")
+    buf.write(f"- **Total Dependencies**: {deps['total_dependencies']}\n")
+    buf.write(f"- **Graph Density**: {deps['graph_density']:.4f}\n")
+    buf.write(f"- **Is Directed Acyclic**: {'✅ Yes' if deps['is_directed_acyclic'] else '❌ No'}\n")
+    buf.write(f"- **Strongly Connected Components**: {deps['strongly_connected_components']}\n\n")
 
     # Show circular dependencies if any
     if deps['circular_dependencies']:
-        result += "## 🔴 Circular Dependencies Detected\n\n"
+        buf.write("## 🔴 Circular Dependencies Detected\n\n")
         for i, cycle in enumerate(deps['circular_dependencies'][:5], 1):  # Show first 5 cycles
-            result += f"**Cycle {i}**: {' → '.join(cycle)} → {cycle[0]}\n"
+            buf.write(f"**Cycle {i}**: {' → '.join(cycle)} → {cycle[0]}\n")
         if len(deps['circular_dependencies']) > 5:
-            result += f"\n*... and {len(deps['circular_dependencies']) - 5} more cycles*\n"
-        result += "\n"
+            buf.write(f"\n*... and {len(deps['circular_dependencies']) - 5} more cycles*\n")
+        buf.write("\n")
 
-    result += "## Import Relationships\n\n"
+    buf.write("## Import Relationships\n\n")
     for file_path, dependencies in deps["dependencies"].items():
         if dependencies:
-            result += f"### {Path(file_path).name}\n"
+            buf.write(f"### {os.path.basename(file_path)}\n")
             for dep in dependencies:
-                result += f"- {dep}\n"
-            result += "\n"
+                buf.write(f"- {dep}\n")
+            buf.write("\n")
 
-    return [types.TextContent(type="text", text=result)]
+    return _text(buf.getvalue())
 
 
 async def handle_project_statistics(engine: UniversalAnalysisEngine, arguments: dict) -> list[types.TextContent]:
     """Handle project_statistics tool with advanced rustworkx insights."""
-    stats = await engine.get_project_stats()
-    insights = await engine.get_code_insights()
-
-    result = "# Advanced Project Statistics (Powered by rustworkx)\n\n"
-    result += "## Overview\n"
-    result += f"- **Project Root**: `{stats['project_root']}`\n"
-    result += f"- **Files Analyzed**: {stats['total_files']}\n"
-    result += f"- **Total Code Elements**: {stats['total_nodes']:,}\n"
-    result += f"- **Relationships**: {stats['total_relationships']:,}\n"
-    result += f"- **Last Analysis**: {stats['last_analysis']}\n\n"
-
-    result += "## Code Structure\n"
-    for node_type, count in stats.get("node_types", {}).items():
-        result += f"- **{node_type.title()}**: {count:,}\n"
-
-    result += "\n## Graph Analytics\n"
-    graph_stats = insights['graph_statistics']
-    result += f"- **Graph Density**: {graph_stats.get('density', 0):.4f}\n"
-    result += f"- **Average Degree**: {graph_stats.get('average_degree', 0):.2f}\n"
-    result += f"- **Is DAG**: {'✅ Yes' if insights['topology_analysis']['is_directed_acyclic'] else '❌ No'}\n"
-    result += f"- **Circular Dependencies**: {insights['topology_analysis']['num_cycles']}\n"
+    revision = await engine.refresh_graph()
+    # Independent queries: overlap them so one can progress while the other waits on I/O
+    stats, insights = await asyncio.gather(
+        _cached_engine_query(engine, revision, "project_stats", engine.get_project_stats),
+        _cached_engine_query(engine, revision, "code_insights", engine.get_code_insights),
+    )
 
-    result += "\n## Critical Structural Elements\n"
+    graph_stats = insights['graph_statistics']
     articulation_points = insights['structural_analysis']['articulation_points']
     bridges = insights['structural_analysis']['bridges']
+    centrality = insights['centrality_analysis']
 
+    critical = []
     if articulation_points:
-        result += "### 🔴 Articulation Points (Critical Nodes)\n"
-        for point in articulation_points[:3]:
-            result += f"- **{point['node_name']}**: {point['critical_impact']}\n"
+        critical.append("### 🔴 Articulation Points (Critical Nodes)\n")
+        critical.extend(
+            f"- **{point['node_name']}**: {point['critical_impact']}\n" for point in articulation_points[:3]
+        )
         if len(articulation_points) > 3:
-            result += f"*... and {len(articulation_points) - 3} more critical nodes*\n"
-
+            critical.append(f"*... and {len(articulation_points) - 3} more critical nodes*\n")
     if bridges:
-        result += "\n### 🔗 Bridge Connections (Critical Links)\n"
-        for bridge in bridges[:3]:
-            result += f"- **{bridge['source_name']} → {bridge['target_name']}**: {bridge['critical_impact']}\n"
+        critical.append("\n### 🔗 Bridge Connections (Critical Links)\n")
+        critical.extend(
+            f"- **{bridge['source_name']} → {bridge['target_name']}**: {bridge['critical_impact']}\n"
+            for bridge in bridges[:3]
+        )
         if len(bridges) > 3:
-            result += f"*... and {len(bridges) - 3} more critical connections*\n"
-
-    result += "\n## Most Central Code Elements (Betweenness)\n"
-    for i, node in enumerate(insights['centrality_analysis']['betweenness_centrality'][:5], 1):
-        result += f"{i}. **{node['node_name']}** ({node['node_type']}) - {node['score']:.4f}\n"
-
-    result += "\n## Most Influential Code Elements (PageRank)\n"
-    for i, node in enumerate(insights['centrality_analysis']['pagerank'][:5], 1):
-        result += f"{i}. **{node['node_name']}** ({node['node_type']}) - {node['score']:.4f}\n"
-
-    return [types.TextContent(type="text", text=result)]
-
-
-def get_tool_definitions() -> list[types.Tool]:
-    """Get the list of available MCP tools."""
-    return [
-        types.Tool(
-            name="get_usage_guide",
-            description="""📚 Get comprehensive guidance on effectively using code analysis tools.""",
-            inputSchema={"type": "object", "properties": {}},
+            critical.append(f"*... and {len(bridges) - 3} more critical connections*\n")
+
+    result = _PROJECT_STATS_TEMPLATE.format(
+        project_root=stats['project_root'],
+        total_files=stats['total_files'],
+        total_nodes=stats['total_nodes'],
+        total_relationships=stats['total_relationships'],
+        last_analysis=stats['last_analysis'],
+        node_types="".join(
+            f"- **{node_type.title()}**: {count:,}\n" for node_type, count in stats.get("node_types", {}).items()
         ),
-        types.Tool(
-            name="analyze_codebase",
-            description="""🔍 Perform comprehensive codebase analysis with metrics and structure overview.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "rebuild_graph": {
-                        "type": "boolean",
-                        "description": "Force rebuild of code graph",
-                        "default": False,
-                    }
-                },
+        density=graph_stats.get('density', 0),
+        average_degree=graph_stats.get('average_degree', 0),
+        is_dag='✅ Yes' if insights['topology_analysis']['is_directed_acyclic'] else '❌ No',
+        num_cycles=insights['topology_analysis']['num_cycles'],
+        critical="".join(critical),
+        betweenness=_format_ranked_nodes(centrality['betweenness_centrality']),
+        pagerank=_format_ranked_nodes(centrality['pagerank']),
+    )
+
+    return _text(result)
+
+
+# Tool schemas are author-controlled, so skip pydantic validation and build them once
+_TOOL_DEFINITIONS: Final[list[types.Tool]] = [
+    types.Tool.model_construct(
+        name="get_usage_guide",
+        description="""📚 Get comprehensive guidance on effectively using code analysis tools.""",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    types.Tool.model_construct(
+        name="analyze_codebase",
+        description="""🔍 Perform comprehensive codebase analysis with metrics and structure overview.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "rebuild_graph": {
+                    "type": "boolean",
+                    "description": "Force rebuild of code graph",
+                    "default": False,
+                }
             },
-        ),
-        types.Tool(
-            name="find_definition",
-            description="""🎯 Find the definition location of a symbol.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {"type": "string", "description": "Symbol name to find definition for"}
-                },
-                "required": ["symbol"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="find_definition",
+        description="""🎯 Find the definition location of a symbol.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {"type": "string", "description": "Symbol name to find definition for"}
             },
-        ),
-        types.Tool(
-            name="find_references",
-            description="""📍 Find all references to a symbol throughout the codebase.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {"type": "string", "description": "Symbol name to find references for"}
-                },
-                "required": ["symbol"],
+            "required": ["symbol"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="find_references",
+        description="""📍 Find all references to a symbol throughout the codebase.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {"type": "string", "description": "Symbol name to find references for"},
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to include in the report",
+                    "default": _DEFAULT_RESULT_LIMIT,
+                    "minimum": 1,
+                }
             },
-        ),
-        types.Tool(
-            name="find_callers",
-            description="""📞 Find all functions that call the specified function.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "function": {"type": "string", "description": "Function name to find callers for"}
-                },
-                "required": ["function"],
+            "required": ["symbol"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="find_callers",
+        description="""📞 Find all functions that call the specified function.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "function": {"type": "string", "description": "Function name to find callers for"},
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to include in the report",
+                    "default": _DEFAULT_RESULT_LIMIT,
+                    "minimum": 1,
+                }
             },
-        ),
-        types.Tool(
-            name="find_callees",
-            description="""📱 Find all functions called by the specified function.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "function": {"type": "string", "description": "Function name to find callees for"}
-                },
-                "required": ["function"],
+            "required": ["function"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="find_callees",
+        description="""📱 Find all functions called by the specified function.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "function": {"type": "string", "description": "Function name to find callees for"},
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to include in the report",
+                    "default": _DEFAULT_RESULT_LIMIT,
+                    "minimum": 1,
+                }
             },
-        ),
-        types.Tool(
-            name="complexity_analysis",
-            description="""📊 Analyze code complexity and identify refactoring opportunities.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "threshold": {
-                        "type": "integer",
-                        "description": "Minimum complexity threshold to report",
-                        "default": 10,
-                    }
+            "required": ["function"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="complexity_analysis",
+        description="""📊 Analyze code complexity and identify refactoring opportunities.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "threshold": {
+                    "type": "integer",
+                    "description": "Minimum complexity threshold to report",
+                    "default": 10,
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to include in the report",
+                    "default": _DEFAULT_COMPLEXITY_LIMIT,
+                    "minimum": 1,
                 },
             },
-        ),
-        types.Tool(
-            name="dependency_analysis",
-            description="""🔗 Analyze module dependencies and import relationships.""",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        types.Tool(
-            name="project_statistics",
-            description="""📈 Get comprehensive project statistics and health metrics.""",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-    ]
+        },
+    ),
+    types.Tool.model_construct(
+        name="dependency_analysis",
+        description="""🔗 Analyze module dependencies and import relationships.""",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    types.Tool.model_construct(
+        name="project_statistics",
+        description="""📈 Get comprehensive project statistics and health metrics.""",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+]
 
 
-def get_tool_handlers():
+def get_tool_definitions() -> list[types.Tool]:
+    """Get the list of available MCP tools."""
+    return _TOOL_DEFINITIONS
+
+
+# Tool name -> handler dispatch table, built once at import
+ToolHandler = Callable[[UniversalAnalysisEngine, dict], Awaitable[list[types.TextContent]]]
+
+_TOOL_HANDLERS: Final[Mapping[str, ToolHandler]] = {
+    "get_usage_guide": handle_get_usage_guide,
+    "analyze_codebase": handle_analyze_codebase,
+    "find_definition": handle_find_definition,
+    "find_references": handle_find_references,
+    "find_callers": handle_find_callers,
+    "find_callees": handle_find_callees,
+    "complexity_analysis": handle_complexity_analysis,
+    "dependency_analysis": handle_dependency_analysis,
+    "project_statistics": handle_project_statistics,
+}
+
+
+def get_tool_handlers() -> Mapping[str, ToolHandler]:
     """Get mapping of tool names to handler functions."""
-    return {
-        "get_usage_guide": handle_get_usage_guide,
-        "analyze_codebase": handle_analyze_codebase,
-        "find_definition": handle_find_definition,
-        "find_references": handle_find_references,
-        "find_callers": handle_find_callers,
-        "find_callees": handle_find_callees,
-        "complexity_analysis": handle_complexity_analysis,
-        "dependency_analysis": handle_dependency_analysis,
-        "project_statistics": handle_project_statistics,
-    }
+    return _TOOL_HANDLERS
 
 
 def main(project_root: Optional[str], verbose: bool) -> int:
     """Main entry point for the MCP server."""
+    _configure_logging()
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -505,33 +677,42 @@ def main(project_root: Optional[str], verbose: bool) -> int:
     @app.list_tools()
     async def list_tools() -> list[types.Tool]:
         """List available tools."""
-        return get_tool_definitions()
+        return _TOOL_DEFINITIONS
 
     @app.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
         """Handle tool calls."""
-        logger.info(f"Received tool call: {name} with arguments: {arguments}")
+        logger.info("Received tool call: %s with arguments: %s", name, arguments)
         try:
             engine = await ensure_analysis_engine_ready(root_path)
-            handlers = get_tool_handlers()
-            handler = handlers.get(name)
+            handler = _TOOL_HANDLERS.get(name)
             if handler:
-                logger.info(f"Executing handler for tool: {name}")
+                logger.info("Executing handler for tool: %s", name)
                 result = await handler(engine, arguments)
-                logger.info(f"Tool {name} completed successfully")
+                logger.info("Tool %s completed successfully", name)
                 return result
             else:
                 raise ValueError(f"Unknown tool: {name}")
 
         except Exception as e:
             logger.exception("Error in tool %s", name)
-            return [types.TextContent(type="text", text=f"❌ Error executing {name}: {str(e)}")]
+            return _text(f"❌ Error executing {name}: {str(e)}")
 
     async def arun():
-        async with stdio_server() as streams:
-            await app.run(streams[0], streams[1], app.create_initialization_options())
-
-    anyio.run(arun)
+        # Turn SIGTERM into cancellation of this task so the cleanup below still runs
+        main_task = asyncio.current_task()
+        with contextlib.suppress(NotImplementedError):  # add_signal_handler is POSIX-only
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+        try:
+            async with stdio_server() as streams:
+                await app.run(streams[0], streams[1], app.create_initialization_options())
+        except asyncio.CancelledError:
+            logger.info("Shutdown requested, stopping MCP server")
+        finally:
+            # Close Redis connections and the file watcher before the loop goes away
+            await cleanup_analysis_engine()
+
+    asyncio.run(arun(), loop_factory=_event_loop_factory())
     return 0
 
 
@@ -543,12 +724,14 @@ def main(project_root: Optional[str], verbose: bool) -> int:
 @click.option("--port", default=8000, type=int, help="Port for SSE mode")
 @click.option("--redis-url", help="Redis URL for caching")
 @click.option("--redis-cache/--no-redis-cache", default=True, help="Enable/disable Redis caching")
-def cli(project_root: Optional[str], verbose: bool, mode: str, host: str, port: int, redis_url: Optional[str], redis_cache: bool) -> int:
+@click.option("--max-concurrent-tools", type=click.IntRange(min=1), default=None, help="Tool calls allowed in flight for SSE mode (default 32)")
+def cli(project_root: Optional[str], verbose: bool, mode: str, host: str, port: int, redis_url: Optional[str], redis_cache: bool, max_concurrent_tools: Optional[int]) -> int:
     """Code Graph Intelligence MCP Server."""
+    _configure_logging()
     if mode == "sse":
         # Run in MCP over HTTP mode (using official SDK patterns)
         try:
-            from codenav.sse_server import CodeGraphMCPServer
+            from codenav.sse_server import DEFAULT_MAX_CONCURRENT_TOOLS, CodeGraphMCPServer
         except ImportError as e:
             logger.error(f"Failed to import HTTP server dependencies: {e}")
             logger.error("Please ensure FastAPI and Uvicorn are installed: pip install fastapi uvicorn")
@@ -561,7 +744,8 @@ def cli(project_root: Optional[str], verbose: bool, mode: str, host: str, port:
         server = CodeGraphMCPServer(
             project_root=root_path,
             redis_url=redis_url if redis_cache else None,
-            json_response=False  # Use SSE streaming by default
+            json_response=False,  # Use SSE streaming by default
+            max_concurrent_tools=max_concurrent_tools or DEFAULT_MAX_CONCURRENT_TOOLS,
         )
         
         try:
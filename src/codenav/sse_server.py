@@ -6,9 +6,11 @@ Proper MCP implementation using official Python SDK patterns.
 Provides code analysis tools through MCP protocol.
 """
 
+import asyncio
 import contextlib
 import logging
 import time
+from collections import deque
 from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Optional
@@ -20,10 +22,11 @@ from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from starlette.applications import Starlette
 from starlette.routing import Mount, Route
 from starlette.responses import JSONResponse
-from starlette.types import Receive, Scope, Send
+from starlette.types import Message, Receive, Scope, Send
 
 # Import our existing MCP infrastructure
 from codenav.server.mcp_server import (
+    _event_loop_factory,
     get_tool_definitions,
     get_tool_handlers,
     ensure_analysis_engine_ready,
@@ -32,6 +35,51 @@ from codenav.server.mcp_server import (
 
 logger = logging.getLogger(__name__)
 
+# Largest MCP request body accepted; JSON-RPC tool calls are a few KB at most
+MAX_REQUEST_BODY_BYTES = 1 << 20
+# Tool calls allowed in flight at once; tools mostly wait on I/O and the analysis lock,
+# so this is set well above the CPU count
+DEFAULT_MAX_CONCURRENT_TOOLS = 32
+
+
+def _declared_body_size(scope: Scope) -> int:
+    """Return the request's Content-Length, or 0 when absent or malformed."""
+    for name, value in scope.get("headers", ()):
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+async def _buffer_request_body(receive: Receive, limit: int) -> Optional[list[Message]]:
+    """Read the request's body messages, or return None once more than limit bytes arrive."""
+    messages = []
+    received = 0
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            return messages
+        received += len(message.get("body", b""))
+        if received > limit:
+            return None
+        if not message.get("more_body", False):
+            return messages
+
+
+def _replay_receive(messages: list[Message], receive: Receive) -> Receive:
+    """Return a receive callable that yields the buffered messages before reading further."""
+    pending = deque(messages)
+
+    async def replay() -> Message:
+        if pending:
+            return pending.popleft()
+        return await receive()
+
+    return replay
+
 
 class CodeGraphMCPServer:
     """MCP Server for Code Graph Analysis using official Python SDK patterns."""
@@ -40,61 +88,73 @@ class CodeGraphMCPServer:
         self, 
         project_root: Path, 
         redis_url: Optional[str] = None,
-        json_response: bool = False
+        json_response: bool = False,
+        max_concurrent_tools: int = DEFAULT_MAX_CONCURRENT_TOOLS,
     ):
         self.project_root = project_root
         self.redis_url = redis_url
         self.json_response = json_response
         self.app = Server("codenav")
         self.analysis_engine = None
+        # Tool calls beyond this many in flight are refused rather than queued without bound
+        self._tool_slots = asyncio.Semaphore(max_concurrent_tools)
         self._setup_handlers()
         
+    async def _execute_tool(self, name: str, arguments: dict) -> list[types.ContentBlock]:
+        """Run one tool through our existing MCP infrastructure."""
+        # Ensure analysis engine is ready
+        self.analysis_engine = await ensure_analysis_engine_ready(
+            self.project_root, self.redis_url
+        )
+        
+        # Get our existing tool handlers
+        handlers = get_tool_handlers()
+        
+        if name not in handlers:
+            raise ValueError(f"Unknown tool: {name}")
+        
+        # Execute the tool using existing infrastructure
+        logger.info("Executing tool: %s", name)
+        result = await handlers[name](self.analysis_engine, arguments)
+        
+        # Convert result to proper MCP ContentBlock format
+        if isinstance(result, list):
+            content_blocks = []
+            for item in result:
+                if hasattr(item, 'text'):
+                    content_blocks.append(
+                        types.TextContent(type="text", text=item.text)
+                    )
+                else:
+                    content_blocks.append(
+                        types.TextContent(type="text", text=str(item))
+                    )
+            return content_blocks
+        else:
+            text = result.text if hasattr(result, 'text') else str(result)
+            return [types.TextContent(type="text", text=text)]
+        
     def _setup_handlers(self):
         """Set up MCP tool handlers using decorators."""
         
         @self.app.call_tool()
         async def call_tool(name: str, arguments: dict) -> list[types.ContentBlock]:
             """Handle tool calls using our existing MCP infrastructure."""
+            if self._tool_slots.locked():
+                logger.warning("Rejecting tool %s: too many tool calls in flight", name)
+                # Raised outside the try below so the SDK returns it as an isError result
+                raise RuntimeError(f"Server busy: too many tool calls in flight, retry {name} later")
+
             try:
-                # Ensure analysis engine is ready
-                self.analysis_engine = await ensure_analysis_engine_ready(
-                    self.project_root, self.redis_url
-                )
-                
-                # Get our existing tool handlers
-                handlers = get_tool_handlers()
-                
-                if name not in handlers:
-                    raise ValueError(f"Unknown tool: {name}")
-                
-                # Execute the tool using existing infrastructure
-                logger.info(f"Executing tool: {name}")
-                result = await handlers[name](self.analysis_engine, arguments)
-                
-                # Convert result to proper MCP ContentBlock format
-                if isinstance(result, list):
-                    content_blocks = []
-                    for item in result:
-                        if hasattr(item, 'text'):
-                            content_blocks.append(
-                                types.TextContent(type="text", text=item.text)
-                            )
-                        else:
-                            content_blocks.append(
-                                types.TextContent(type="text", text=str(item))
-                            )
-                    return content_blocks
-                else:
-                    text = result.text if hasattr(result, 'text') else str(result)
-                    return [types.TextContent(type="text", text=text)]
-                    
+                async with self._tool_slots:
+                    return await self._execute_tool(name, arguments)
             except Exception as e:
                 logger.error(f"Error executing tool {name}: {e}")
                 return [types.TextContent(
                     type="text", 
                     text=f"Error executing tool {name}: {str(e)}"
                 )]
-        
+
         @self.app.list_tools()
         async def list_tools() -> list[types.Tool]:
             """List available tools using our existing infrastructure."""
@@ -185,6 +245,20 @@ class CodeGraphMCPServer:
 
         async def handle_mcp_request(scope: Scope, receive: Receive, send: Send) -> None:
             """Handle MCP requests through StreamableHTTP transport."""
+            too_large = _declared_body_size(scope) > MAX_REQUEST_BODY_BYTES
+            if not too_large and scope["method"] == "POST":
+                # Content-Length may be missing (chunked) or wrong, so count what actually arrives
+                messages = await _buffer_request_body(receive, MAX_REQUEST_BODY_BYTES)
+                too_large = messages is None
+                if not too_large:
+                    receive = _replay_receive(messages, receive)
+            if too_large:
+                response = JSONResponse(
+                    {"error": f"Request body exceeds {MAX_REQUEST_BODY_BYTES} bytes"},
+                    status_code=413,
+                )
+                await response(scope, receive, send)
+                return
             await session_manager.handle_request(scope, receive, send)
 
         @contextlib.asynccontextmanager
@@ -211,12 +285,21 @@ class CodeGraphMCPServer:
         
         return starlette_app
     
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000):
+        """Serve the MCP server on the already-running event loop."""
+        import uvicorn
+
+        config = uvicorn.Config(
+            self.create_starlette_app(),
+            host=host,
+            port=port,
+            log_config=None,  # Keep the process-wide logging configuration
+        )
+        await uvicorn.Server(config).serve()
+
     def run(self, host: str = "127.0.0.1", port: int = 8000):
         """Run the MCP server."""
-        starlette_app = self.create_starlette_app()
-        
-        import uvicorn
-        uvicorn.run(starlette_app, host=host, port=port)
+        asyncio.run(self.serve(host=host, port=port), loop_factory=_event_loop_factory())
 
 
 @click.command()
@@ -235,6 +318,12 @@ class CodeGraphMCPServer:
     default="INFO",
     help="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
 )
+@click.option(
+    "--max-concurrent-tools",
+    default=DEFAULT_MAX_CONCURRENT_TOOLS,
+    type=click.IntRange(min=1),
+    help="Tool calls allowed in flight before new ones are refused as busy",
+)
 def main(
     project_root: str,
     host: str,
@@ -242,6 +331,7 @@ def main(
     redis_url: Optional[str],
     json_response: bool,
     log_level: str,
+    max_concurrent_tools: int,
 ) -> int:
     """Run Code Graph MCP Server."""
     
@@ -260,7 +350,8 @@ def main(
     server = CodeGraphMCPServer(
         project_root=root_path,
         redis_url=redis_url,
-        json_response=json_response
+        json_response=json_response,
+        max_concurrent_tools=max_concurrent_tools,
     )
     
     try:
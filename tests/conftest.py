@@ -4,3 +4,11 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+
+
+def pytest_configure(config):
+    # pytest.ini's [tool:pytest] section is not read, so register markers here
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): groups tests onto one pytest-xdist worker (only with --dist loadgroup)",
+    )
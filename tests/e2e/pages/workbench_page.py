@@ -5,8 +5,40 @@ This module provides a page object for interacting with the workbench
 navigation components in the CodeNav frontend.
 """
 
+import asyncio
+from collections import deque
 from typing import Optional
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# Upper bound on captured console messages and page errors per page
+_MAX_CAPTURED_MESSAGES = 5000
+
+# Returns 'grid' or 'list' for whichever view-mode button is pressed, else null
+_CURRENT_VIEW_MODE_JS = """() => {
+    for (const mode of ['grid', 'list']) {
+        const button = document.querySelector(`[data-test="view-mode-${mode}"]`);
+        if (button && button.getAttribute('aria-pressed') === 'true') return mode;
+    }
+    return null;
+}"""
+
+# Existence check that returns a boolean rather than an element handle
+_ELEMENT_EXISTS_JS = "(selector) => document.querySelector(selector) !== null"
+
+# Resolves after n animation frames, by which time handler errors have reached pageerror
+_FLUSH_FRAMES_JS = """(n) => new Promise((resolve) => {
+    const step = (remaining) => remaining <= 0
+        ? resolve()
+        : requestAnimationFrame(() => step(remaining - 1));
+    step(n);
+})"""
+
+# Existence check for a {name: selector} mapping, returning {name: boolean}
+_PROBE_SELECTORS_JS = """(selectors) => Object.fromEntries(
+    Object.entries(selectors).map(([name, selector]) => [name, !!document.querySelector(selector)])
+)"""
+
 
 class WorkbenchPage:
     """Page Object Model for the workbench canvas and navigation components."""
@@ -27,15 +59,39 @@ class WorkbenchPage:
         # Wait for the page to be ready (stats badge appears when graph loads)
         await self.page.wait_for_selector("text=nodes", timeout=15000)
 
+    async def probe_selectors(self, selectors: dict) -> dict:
+        """
+        Check which selectors match an element, in a single browser round-trip.
+
+        Args:
+            selectors: Mapping of name to CSS selector
+
+        Returns:
+            Mapping of the same names to whether the selector matched
+        """
+        return await self.page.evaluate(_PROBE_SELECTORS_JS, selectors)
+
+    async def wait_until_ready(self):
+        """Wait until the graph view is interactive (dimension controls rendered)."""
+        await self.page.wait_for_load_state("domcontentloaded")
+        await self.page.wait_for_selector("text=2D", state="visible", timeout=5000)
+
+    async def flush_frames(self, n: int = 2):
+        """
+        Wait for the page to render n animation frames.
+
+        Args:
+            n: Number of frames to wait for
+        """
+        await self.page.evaluate(_FLUSH_FRAMES_JS, n)
+
     async def wait_for_loading_complete(self):
         """Wait for any loading overlays to disappear."""
-        # Wait for loading spinner to disappear
+        # state="hidden" also resolves immediately when no spinner is attached
         try:
-            loading = await self.page.query_selector(".animate-spin")
-            if loading:
-                await self.page.wait_for_selector(".animate-spin", state="hidden", timeout=10000)
-        except Exception:
-            pass  # No loading indicator found
+            await self.page.wait_for_selector(".animate-spin", state="hidden", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass  # Spinner still showing; let the caller's assertions report it
 
     # ==================
     # Breadcrumb Navigation
@@ -47,19 +103,18 @@ class WorkbenchPage:
 
     async def is_breadcrumb_visible(self) -> bool:
         """Check if the breadcrumb navigation is visible."""
-        breadcrumb = await self.get_breadcrumb_navigation()
-        return breadcrumb is not None
+        return await self.page.evaluate(
+            _ELEMENT_EXISTS_JS, '[data-test="breadcrumb-navigation"]'
+        )
 
     async def click_home_button(self):
         """Click the home button in the breadcrumb navigation."""
-        button = await self.page.wait_for_selector('[data-test="nav-home-button"]', timeout=5000)
-        await button.click()
+        await self.page.locator('[data-test="nav-home-button"]').click(timeout=5000)
         await self.wait_for_loading_complete()
 
     async def click_back_button(self):
         """Click the back button in the breadcrumb navigation."""
-        button = await self.page.wait_for_selector('[data-test="nav-back-button"]', timeout=5000)
-        await button.click()
+        await self.page.locator('[data-test="nav-back-button"]').click(timeout=5000)
         await self.wait_for_loading_complete()
 
     async def click_breadcrumb_level(self, level: int):
@@ -69,9 +124,7 @@ class WorkbenchPage:
         Args:
             level: The zero-based index of the breadcrumb level to click
         """
-        selector = f'[data-test="breadcrumb-{level}"]'
-        button = await self.page.wait_for_selector(selector, timeout=5000)
-        await button.click()
+        await self.page.locator(f'[data-test="breadcrumb-{level}"]').click(timeout=5000)
         await self.wait_for_loading_complete()
 
     async def get_breadcrumb_count(self) -> int:
@@ -118,8 +171,7 @@ class WorkbenchPage:
         Args:
             node_id: The ID of the node to click
         """
-        card = await self.page.wait_for_selector(f'[data-test="node-card-{node_id}"]', timeout=5000)
-        await card.click()
+        await self.page.locator(f'[data-test="node-card-{node_id}"]').click(timeout=5000)
 
     async def double_click_node_card(self, node_id: str):
         """
@@ -128,8 +180,7 @@ class WorkbenchPage:
         Args:
             node_id: The ID of the node to drill into
         """
-        card = await self.page.wait_for_selector(f'[data-test="node-card-{node_id}"]', timeout=5000)
-        await card.dblclick()
+        await self.page.locator(f'[data-test="node-card-{node_id}"]').dblclick(timeout=5000)
         await self.wait_for_loading_complete()
 
     # ==================
@@ -142,8 +193,9 @@ class WorkbenchPage:
 
     async def is_workbench_empty(self) -> bool:
         """Check if the workbench shows the empty state."""
-        empty = await self.page.query_selector('[data-testid="workbench-canvas-empty"]')
-        return empty is not None
+        return await self.page.evaluate(
+            _ELEMENT_EXISTS_JS, '[data-testid="workbench-canvas-empty"]'
+        )
 
     # ==================
     # View Mode Controls
@@ -151,13 +203,11 @@ class WorkbenchPage:
 
     async def set_view_mode_grid(self):
         """Switch to grid view mode."""
-        button = await self.page.wait_for_selector('[data-test="view-mode-grid"]', timeout=5000)
-        await button.click()
+        await self.page.locator('[data-test="view-mode-grid"]').click(timeout=5000)
 
     async def set_view_mode_list(self):
         """Switch to list view mode."""
-        button = await self.page.wait_for_selector('[data-test="view-mode-list"]', timeout=5000)
-        await button.click()
+        await self.page.locator('[data-test="view-mode-list"]').click(timeout=5000)
 
     async def get_current_view_mode(self) -> Optional[str]:
         """
@@ -166,19 +216,8 @@ class WorkbenchPage:
         Returns:
             'grid', 'list', or None if unable to determine
         """
-        grid_button = await self.page.query_selector('[data-test="view-mode-grid"]')
-        if grid_button:
-            is_pressed = await grid_button.get_attribute('aria-pressed')
-            if is_pressed == 'true':
-                return 'grid'
-
-        list_button = await self.page.query_selector('[data-test="view-mode-list"]')
-        if list_button:
-            is_pressed = await list_button.get_attribute('aria-pressed')
-            if is_pressed == 'true':
-                return 'list'
-
-        return None
+        # Resolve both buttons in one browser round-trip instead of four
+        return await self.page.evaluate(_CURRENT_VIEW_MODE_JS)
 
     async def get_children_grid(self):
         """Get the children grid container."""
@@ -188,6 +227,16 @@ class WorkbenchPage:
         """Get the children list container."""
         return await self.page.query_selector('[data-test="children-list"]')
 
+    async def get_children_containers(self):
+        """
+        Get the children grid and list containers together.
+
+        Returns:
+            Tuple of (grid, list) elements, either of which may be None
+        """
+        # Independent lookups: issue both so the CDP messages pipeline
+        return await asyncio.gather(self.get_children_grid(), self.get_children_list())
+
     # ==================
     # Sort Controls
     # ==================
@@ -199,8 +248,9 @@ class WorkbenchPage:
         Args:
             sort_option: One of 'complexity', 'name', 'type', 'lines'
         """
-        select = await self.page.wait_for_selector('[data-test="sort-by-select"]', timeout=5000)
-        await select.select_option(value=sort_option)
+        await self.page.locator('[data-test="sort-by-select"]').select_option(
+            value=sort_option, timeout=5000
+        )
 
     async def get_sort_by(self) -> Optional[str]:
         """Get the current sort option."""
@@ -217,16 +267,26 @@ class WorkbenchPage:
         """Get the force graph canvas container."""
         return await self.page.query_selector('.bg-slate-900.rounded-lg')
 
+    async def wait_for_graph_dimension(self, dimension: str):
+        """
+        Wait until the graph has switched to the given dimension.
+
+        Args:
+            dimension: '2D' or '3D'
+        """
+        # The active toggle is highlighted and the graph container re-renders its canvas
+        await self.page.wait_for_selector(
+            f'button[title="{dimension} view"].bg-indigo-600', timeout=3000
+        )
+        await self.page.wait_for_selector(
+            ".bg-slate-900.rounded-lg canvas", state="attached", timeout=3000
+        )
+
     async def double_click_graph_center(self):
         """Double-click in the center of the graph canvas."""
-        canvas = await self.get_graph_canvas()
-        if canvas:
-            box = await canvas.bounding_box()
-            if box:
-                center_x = box["x"] + box["width"] / 2
-                center_y = box["y"] + box["height"] / 2
-                await self.page.mouse.dblclick(center_x, center_y)
-                await self.wait_for_loading_complete()
+        # Locator clicks target the element's center by default
+        await self.page.locator(".bg-slate-900.rounded-lg").dblclick(timeout=5000)
+        await self.wait_for_loading_complete()
 
     # ==================
     # Keyboard Navigation
@@ -243,11 +303,12 @@ class WorkbenchPage:
 
     async def focus_first_node_card(self):
         """Focus the first node card on the page."""
-        cards = await self.get_all_node_cards()
-        if cards and len(cards) > 0:
-            await cards[0].focus()
-            return True
-        return False
+        # Count and focus in the page rather than fetching a handle per card
+        cards = self.page.locator('[data-test^="node-card-"]')
+        if await cards.count() == 0:
+            return False
+        await cards.first.focus()
+        return True
 
     # ==================
     # Console and Errors
@@ -255,19 +316,37 @@ class WorkbenchPage:
 
     def setup_console_capture(self):
         """Set up console message capture. Call before navigation."""
-        self.console_messages = []
-        self.page_errors = []
-
-        self.page.on("console", lambda msg: self.console_messages.append({
-            "type": msg.type,
-            "text": msg.text
-        }))
-        self.page.on("pageerror", lambda err: self.page_errors.append(str(err)))
+        # Bounded so long-running tests keep constant memory; errors are
+        # filtered at capture time so get_console_errors() needs no scan
+        self.console_messages = deque(maxlen=_MAX_CAPTURED_MESSAGES)
+        self._console_errors = deque(maxlen=_MAX_CAPTURED_MESSAGES)
+        self.page_errors = deque(maxlen=_MAX_CAPTURED_MESSAGES)
+        self._page_errors_lower = deque(maxlen=_MAX_CAPTURED_MESSAGES)
+
+        self.page.on("console", self._on_console)
+        self.page.on("pageerror", self._on_page_error)
+
+    def _on_console(self, msg):
+        """Record a console message, tracking errors separately."""
+        message = {"type": msg.type, "text": msg.text}
+        self.console_messages.append(message)
+        if message["type"] == "error":
+            self._console_errors.append(message)
+
+    def _on_page_error(self, err):
+        """Record an uncaught page error along with its lowercased form."""
+        text = str(err)
+        self.page_errors.append(text)
+        self._page_errors_lower.append(text.lower())
 
     def get_console_errors(self):
         """Get all console error messages."""
-        return [m for m in self.console_messages if m["type"] == "error"]
+        return list(self._console_errors)
 
     def get_page_errors(self):
         """Get all uncaught page errors."""
-        return self.page_errors
+        return list(self.page_errors)
+
+    def get_page_errors_normalized(self):
+        """Get all uncaught page errors lowercased, for case-insensitive filtering."""
+        return list(self._page_errors_lower)
@@ -9,19 +9,57 @@ Tests verify:
 - Keyboard navigation works for node cards
 """
 
+import asyncio
+
 import pytest
+import pytest_asyncio
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from .pages import WorkbenchPage
 
-
-@pytest.fixture
-async def page(browser):
+# Session-scoped browser state means every test must run on the session loop.
+# Tests are independent, so run them with `pytest tests/e2e -n auto --dist=loadgroup`;
+# the read-only tests share the xdist group "workbench_readonly" so they land on one
+# worker and reuse its loaded_workbench page.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# These tests look for crashes, not slow renders; fail fast instead of idling on timeouts
+DEFAULT_TIMEOUT_MS = 3000
+# Page loads still get the usual budget, since a cold Vite dev server compiles on first request
+NAVIGATION_TIMEOUT_MS = 30000
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def context(browser):
+    """Share one browser context (cookies, service workers, bundle cache) across tests."""
+    ctx = await browser.new_context()
+    ctx.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    ctx.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    yield ctx
+    await ctx.close()
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True, loop_scope="session")
+async def _warm_browser(context):
+    """Load the app once up front so the first test sees a warm browser and HTTP cache."""
+    page = await context.new_page()
+    try:
+        await page.goto(WorkbenchPage(page).base_url, wait_until="domcontentloaded")
+        await page.wait_for_selector("text=2D", timeout=10000)
+    except PlaywrightTimeoutError:
+        pass  # Best effort; the tests themselves report an unreachable app
+    finally:
+        await page.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(context):
     """Create a new page for each test."""
-    page = await browser.new_page()
+    page = await context.new_page()
     yield page
     await page.close()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def workbench_page(page):
     """Create a WorkbenchPage instance with console capture."""
     wb_page = WorkbenchPage(page)
@@ -29,76 +67,82 @@ async def workbench_page(page):
     return wb_page
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def loaded_workbench(context):
+    """
+    Navigate once and share the loaded WorkbenchPage between read-only tests.
+
+    Tests using this fixture must not change page state.
+    """
+    page = await context.new_page()
+    wb_page = WorkbenchPage(page)
+    wb_page.setup_console_capture()
+    await wb_page.goto()
+    await wb_page.wait_until_ready()
+    yield wb_page
+    await page.close()
+
+
 class TestWorkbenchNavigation:
     """Test workbench navigation functionality."""
 
-    @pytest.mark.asyncio
     async def test_graph_loads_without_errors(self, workbench_page):
         """Verify graph loads without throwing uncaught exceptions."""
         await workbench_page.goto()
 
-        # Wait a bit for any delayed errors
-        await workbench_page.page.wait_for_timeout(2000)
+        # Wait until the graph is interactive so load-time errors have surfaced
+        await workbench_page.wait_until_ready()
 
         # Should have no uncaught page errors
         errors = workbench_page.get_page_errors()
         assert len(errors) == 0, f"Uncaught errors: {errors}"
 
-    @pytest.mark.asyncio
-    async def test_breadcrumb_hidden_initially(self, workbench_page):
+    @pytest.mark.xdist_group("workbench_readonly")
+    async def test_breadcrumb_hidden_initially(self, loaded_workbench):
         """Verify breadcrumb navigation is hidden when not navigating."""
-        await workbench_page.goto()
-
-        # Wait for graph to load
-        await workbench_page.page.wait_for_timeout(2000)
-
         # Breadcrumb should not be visible initially (no navigation)
-        visible = await workbench_page.is_breadcrumb_visible()
+        visible = await loaded_workbench.is_breadcrumb_visible()
         # Note: This test verifies initial state - breadcrumb visibility depends
         # on whether the workbench canvas is integrated with the main App.
         # If testing against the graph view, breadcrumb won't be visible.
 
-    @pytest.mark.asyncio
-    async def test_navigation_controls_visible(self, workbench_page):
+    @pytest.mark.xdist_group("workbench_readonly")
+    async def test_navigation_controls_visible(self, loaded_workbench):
         """Verify graph dimension controls are visible."""
-        await workbench_page.goto()
-
-        # Wait for 2D button to be visible
-        button_2d = await workbench_page.page.wait_for_selector("text=2D", timeout=5000)
+        # Wait for the 2D and 3D buttons to be visible (independent, so concurrently)
+        button_2d, button_3d = await asyncio.gather(
+            loaded_workbench.page.wait_for_selector("text=2D"),
+            loaded_workbench.page.wait_for_selector("text=3D"),
+        )
         assert button_2d is not None
-
-        # Wait for 3D button to be visible
-        button_3d = await workbench_page.page.wait_for_selector("text=3D", timeout=5000)
         assert button_3d is not None
 
-    @pytest.mark.asyncio
     async def test_no_uncaught_exceptions_on_canvas_interaction(self, workbench_page):
         """Verify no uncaught exceptions when interacting with the graph canvas."""
         await workbench_page.goto()
 
         # Double-click on the graph canvas
         await workbench_page.double_click_graph_center()
-        await workbench_page.page.wait_for_timeout(500)
+        await workbench_page.flush_frames()
 
         # Check for uncaught errors
-        errors = workbench_page.get_page_errors()
-        node_errors = [e for e in errors if "node" in e.lower()]
+        errors = workbench_page.get_page_errors_normalized()
+        node_errors = [e for e in errors if "node" in e]
         assert len(node_errors) == 0, f"Uncaught node-related errors: {node_errors}"
 
-    @pytest.mark.asyncio
     async def test_dimension_toggle_no_errors(self, workbench_page):
         """Verify switching between 2D and 3D doesn't cause errors."""
         await workbench_page.goto()
 
         # Switch to 3D
-        button_3d = await workbench_page.page.wait_for_selector("text=3D", timeout=5000)
+        button_3d = await workbench_page.page.wait_for_selector("text=3D")
         await button_3d.click()
-        await workbench_page.page.wait_for_timeout(1000)
+        await workbench_page.wait_for_graph_dimension("3D")
 
         # Switch back to 2D
-        button_2d = await workbench_page.page.wait_for_selector("text=2D", timeout=5000)
+        button_2d = await workbench_page.page.wait_for_selector("text=2D")
         await button_2d.click()
-        await workbench_page.page.wait_for_timeout(1000)
+        await workbench_page.wait_for_graph_dimension("2D")
 
         # Should have no uncaught exceptions
         errors = workbench_page.get_page_errors()
@@ -108,26 +152,22 @@ class TestWorkbenchNavigation:
 class TestDoubleClickDrillDown:
     """Test double-click drill-down functionality."""
 
-    @pytest.mark.asyncio
-    async def test_double_click_hint_appears(self, workbench_page):
+    @pytest.mark.xdist_group("workbench_readonly")
+    async def test_double_click_hint_appears(self, loaded_workbench):
         """Verify double-click hint is shown when graph loads."""
-        await workbench_page.goto()
-
         # Wait for the hint about double-click to appear
-        hint = await workbench_page.page.wait_for_selector(
-            "text=Double-click a node to drill into its local subgraph",
-            timeout=10000
+        hint = await loaded_workbench.page.wait_for_selector(
+            "text=Double-click a node to drill into its local subgraph"
         )
         assert hint is not None
 
-    @pytest.mark.asyncio
     async def test_double_click_on_canvas_no_crash(self, workbench_page):
         """Verify double-clicking on empty canvas area doesn't crash."""
         await workbench_page.goto()
 
         # Double-click on canvas (might not hit a node, but shouldn't throw)
         await workbench_page.double_click_graph_center()
-        await workbench_page.page.wait_for_timeout(500)
+        await workbench_page.flush_frames()
 
         # Verify page is still functional
         stats_badge = await workbench_page.page.query_selector("text=nodes")
@@ -137,31 +177,24 @@ class TestDoubleClickDrillDown:
 class TestBreadcrumbNavigation:
     """Test breadcrumb navigation functionality."""
 
-    @pytest.mark.asyncio
-    async def test_back_button_hidden_initially(self, workbench_page):
+    @pytest.mark.xdist_group("workbench_readonly")
+    async def test_back_button_hidden_initially(self, loaded_workbench):
         """Verify back button is not visible when not navigating."""
-        await workbench_page.goto()
-        await workbench_page.page.wait_for_timeout(2000)
-
         # The back button should not be visible initially
-        back_button = await workbench_page.page.query_selector('[title="Go back"]')
-        assert back_button is None, "Back button should not be visible initially"
+        probes = await loaded_workbench.probe_selectors({"back": '[title="Go back"]'})
+        assert not probes["back"], "Back button should not be visible initially"
 
-    @pytest.mark.asyncio
-    async def test_home_button_hidden_initially(self, workbench_page):
+    @pytest.mark.xdist_group("workbench_readonly")
+    async def test_home_button_hidden_initially(self, loaded_workbench):
         """Verify home button is not visible when not navigating."""
-        await workbench_page.goto()
-        await workbench_page.page.wait_for_timeout(2000)
-
         # The home button should not be visible initially
-        home_button = await workbench_page.page.query_selector('[title="Return to full graph"]')
-        assert home_button is None, "Home button should not be visible initially"
+        probes = await loaded_workbench.probe_selectors({"home": '[title="Return to full graph"]'})
+        assert not probes["home"], "Home button should not be visible initially"
 
 
 class TestKeyboardNavigation:
     """Test keyboard navigation functionality."""
 
-    @pytest.mark.asyncio
     async def test_keyboard_focus_visible(self, workbench_page):
         """Verify keyboard focus is visible on interactive elements."""
         await workbench_page.goto()
@@ -180,17 +213,16 @@ class TestKeyboardNavigation:
 class TestNodeNotFoundHandling:
     """Test handling of node not found scenarios."""
 
-    @pytest.mark.asyncio
     async def test_console_warnings_on_invalid_node(self, workbench_page):
         """Verify console warnings are logged instead of throwing for invalid nodes."""
         await workbench_page.goto()
-        await workbench_page.page.wait_for_timeout(2000)
+        await workbench_page.wait_until_ready()
 
         # Check that no page errors related to "node not found" were thrown
-        errors = workbench_page.get_page_errors()
+        errors = workbench_page.get_page_errors_normalized()
         node_not_found_errors = [
             e for e in errors
-            if "node not found" in e.lower() or "cannot read" in e.lower()
+            if "node not found" in e or "cannot read" in e
         ]
         assert len(node_not_found_errors) == 0, \
             f"Uncaught 'node not found' errors: {node_not_found_errors}"
@@ -199,16 +231,15 @@ class TestNodeNotFoundHandling:
 class TestViewModeToggle:
     """Test view mode toggle functionality (when workbench is visible)."""
 
-    @pytest.mark.asyncio
-    async def test_view_mode_buttons_accessible(self, workbench_page):
+    @pytest.mark.xdist_group("workbench_readonly")
+    async def test_view_mode_buttons_accessible(self, loaded_workbench):
         """Verify view mode buttons can be queried when workbench is active."""
-        await workbench_page.goto()
-        await workbench_page.page.wait_for_timeout(2000)
-
         # This test documents the expected selectors for when workbench is active
         # The buttons will only be present when WorkbenchCanvas is rendered
-        grid_button = await workbench_page.page.query_selector('[data-test="view-mode-grid"]')
-        list_button = await workbench_page.page.query_selector('[data-test="view-mode-list"]')
+        probes = await loaded_workbench.probe_selectors({
+            "view_grid": '[data-test="view-mode-grid"]',
+            "view_list": '[data-test="view-mode-list"]',
+        })
 
         # Note: These may be None if workbench is not yet integrated into main app
         # This test serves as documentation for the expected selectors
@@ -217,14 +248,11 @@ class TestViewModeToggle:
 class TestSortControls:
     """Test sort control functionality (when workbench is visible)."""
 
-    @pytest.mark.asyncio
-    async def test_sort_select_accessible(self, workbench_page):
+    @pytest.mark.xdist_group("workbench_readonly")
+    async def test_sort_select_accessible(self, loaded_workbench):
         """Verify sort select can be queried when workbench is active."""
-        await workbench_page.goto()
-        await workbench_page.page.wait_for_timeout(2000)
-
         # This test documents the expected selector for when workbench is active
-        sort_select = await workbench_page.page.query_selector('[data-test="sort-by-select"]')
+        probes = await loaded_workbench.probe_selectors({"sort": '[data-test="sort-by-select"]'})
 
         # Note: May be None if workbench is not yet integrated into main app
         # This test serves as documentation for the expected selectors
@@ -10,11 +10,14 @@ Evaluation Metrics:
 
 import sys
 import asyncio
+import contextlib
+import gzip
 import json
 from typing import Dict, List, Any
 from pathlib import Path
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add notebooks utils to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "notebooks" / "utils"))
@@ -22,7 +25,83 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import redis.asyncio as redis
 import httpx
-import networkx as nx
+import rustworkx as rx
+
+try:
+    import orjson
+    loads_json = orjson.loads
+    
+    def dumps_json(data: Any) -> bytes:
+        """Serialize data as indented JSON, stringifying unknown types"""
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+except ImportError:
+    loads_json = json.loads
+    
+    def dumps_json(data: Any) -> bytes:
+        """Serialize data as indented JSON, stringifying unknown types"""
+        return json.dumps(data, indent=2, default=str).encode()
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep-alive pool sized for the gathered evaluator requests; idle connections are
+# kept for the length of a run so later evaluator phases reuse them
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+
+# Service endpoints used when run_evaluation is not given them, read once at import
+DEFAULT_REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379")
+DEFAULT_API_URL = os.getenv("BACKEND_API_URL", "http://code-graph-http:8000")
+
+
+async def stream_items(response: httpx.Response, prefix: str):
+    """
+    Yield the items of the JSON array at prefix (ijson syntax, e.g. 'results.item')
+    
+    With ijson installed the body is parsed incrementally as chunks arrive, so the
+    raw payload is never held in memory alongside the parsed items.
+    """
+    if not IJSON_AVAILABLE:
+        data = loads_json(await response.aread())
+        for key in prefix.split('.')[:-1]:
+            data = data.get(key, [])
+        for item in data:
+            yield item
+        return
+    
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    async for chunk in response.aiter_bytes():
+        parser.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    parser.close()
+    for item in items:
+        yield item
+
+
+def create_http_client(api_url: str) -> httpx.AsyncClient:
+    """Create a pooled backend API client, multiplexed over HTTP/2 when h2 is installed"""
+    return httpx.AsyncClient(
+        base_url=api_url,
+        http2=HTTP2_AVAILABLE,
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT,
+    )
 
 
 # ============================================================================
@@ -32,24 +111,40 @@ import networkx as nx
 class DataConsistencyEvaluator:
     """Evaluates data consistency between Redis CDC and backend API"""
     
-    def __init__(self):
-        self.redis_client = None
-        self.http_client = None
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        redis_client: redis.Redis | None = None,
+    ):
+        # Injected clients are shared with other evaluators and closed by their owner
+        self.redis_client = redis_client
+        self._owns_redis_client = redis_client is None
+        self.http_client = http_client
+        self._owns_http_client = http_client is None
         self.results = []
+        # The Memgraph driver is blocking; queries run here so gathered checks overlap
+        self._query_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="memgraph-query")
     
     async def setup(self, redis_url: str, api_url: str):
         """Initialize connections"""
         try:
-            self.redis_client = await redis.from_url(redis_url, decode_responses=True)
+            if self._owns_redis_client:
+                self.redis_client = await redis.from_url(redis_url, decode_responses=True)
             await self.redis_client.ping()
             print("✅ Redis connected")
         except Exception as e:
             print(f"⚠️  Redis connection failed: {e}")
         
-        self.http_client = httpx.AsyncClient(base_url=api_url)
+        if self._owns_http_client:
+            self.http_client = create_http_client(api_url)
         print("✅ HTTP client ready")
     
-    def _query_memgraph(self, query: str) -> List[Dict]:
+    async def _query_memgraph(self, query: str) -> List[Dict]:
+        """Execute query on Memgraph without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._query_executor, self._query_memgraph_sync, query)
+    
+    def _query_memgraph_sync(self, query: str) -> List[Dict]:
         """Execute query on Memgraph"""
         if not self.memgraph_driver:
             return []
@@ -69,7 +164,7 @@ class DataConsistencyEvaluator:
             cdc_events = await self.redis_client.xlen("graph:cdc") if self.redis_client else 0
             
             # Count nodes in Memgraph
-            memgraph_nodes = self._query_memgraph("MATCH (n) RETURN count(n) as count")
+            memgraph_nodes = await self._query_memgraph("MATCH (n) RETURN count(n) as count")
             memgraph_count = memgraph_nodes[0]['count'] if memgraph_nodes else 0
             
             result = {
@@ -92,7 +187,7 @@ class DataConsistencyEvaluator:
     async def check_relationship_consistency(self) -> Dict[str, Any]:
         """Check if RELATIONSHIP_ADDED events are synced"""
         try:
-            memgraph_rels = self._query_memgraph("MATCH ()-[r]->() RETURN count(r) as count")
+            memgraph_rels = await self._query_memgraph("MATCH ()-[r]->() RETURN count(r) as count")
             memgraph_count = memgraph_rels[0]['count'] if memgraph_rels else 0
             
             result = {
@@ -115,14 +210,14 @@ class DataConsistencyEvaluator:
         """Check that synced nodes have all required attributes"""
         try:
             # Query for nodes with missing critical attributes
-            missing_attrs = self._query_memgraph("""
+            missing_attrs = await self._query_memgraph("""
             MATCH (n:Function)
             WHERE n.name IS NULL OR n.file IS NULL OR n.language IS NULL
             RETURN count(n) as missing_count
             """)
             
             missing_count = missing_attrs[0]['missing_count'] if missing_attrs else 0
-            total_nodes = self._query_memgraph("MATCH (n:Function) RETURN count(n) as count")
+            total_nodes = await self._query_memgraph("MATCH (n:Function) RETURN count(n) as count")
             total_count = total_nodes[0]['count'] if total_nodes else 0
             
             result = {
@@ -145,10 +240,16 @@ class DataConsistencyEvaluator:
     
     async def evaluate_all(self) -> Dict[str, Any]:
         """Run all consistency checks"""
+        # The checks touch disjoint queries, so run them concurrently
+        node_result, rel_result, attr_result = await asyncio.gather(
+            self.check_node_consistency(),
+            self.check_relationship_consistency(),
+            self.check_node_attribute_integrity(),
+        )
         results = {
-            "node_consistency": await self.check_node_consistency(),
-            "relationship_consistency": await self.check_relationship_consistency(),
-            "attribute_integrity": await self.check_node_attribute_integrity(),
+            "node_consistency": node_result,
+            "relationship_consistency": rel_result,
+            "attribute_integrity": attr_result,
         }
         
         # Calculate overall consistency score
@@ -165,10 +266,13 @@ class DataConsistencyEvaluator:
     
     async def cleanup(self):
         """Close connections"""
-        if self.redis_client:
-            await self.redis_client.aclose()
-        if self.http_client:
-            await self.http_client.aclose()
+        try:
+            if self.redis_client and self._owns_redis_client:
+                await self.redis_client.aclose()
+            if self.http_client and self._owns_http_client:
+                await self.http_client.aclose()
+        finally:
+            self._query_executor.shutdown(wait=False)
 
 
 # ============================================================================
@@ -178,25 +282,33 @@ class DataConsistencyEvaluator:
 class QueryPerformanceEvaluator:
     """Evaluates query performance via backend API"""
     
-    def __init__(self):
-        self.http_client = None
+    def __init__(self, enabled: bool = False, http_client: httpx.AsyncClient | None = None):
+        # _run_query is a stub until the backend exposes a Cypher query endpoint;
+        # leave disabled so stub timings are not reported as measurements
+        self.enabled = enabled
+        self.http_client = http_client
+        self._owns_http_client = http_client is None
         self.results = []
     
     async def setup(self, api_url: str):
         """Initialize HTTP client"""
-        self.http_client = httpx.AsyncClient(base_url=api_url)
+        if self._owns_http_client:
+            self.http_client = create_http_client(api_url)
+        # Caps in-flight queries so gathered tests cannot exhaust sockets
+        self._sem = asyncio.Semaphore(int(os.getenv("QUERY_PERF_CONCURRENCY", "16")))
         print("✅ HTTP client ready")
     
-    def _run_query(self, query: str) -> tuple[int, float]:
+    async def _run_query(self, query: str) -> tuple[int, float]:
         """Execute query via API and measure performance"""
-        # Note: This would require backend API to expose query endpoint
-        # For now, we'll test via graph stats endpoint
-        return 0, 0.0
+        async with self._sem:
+            # Note: This would require backend API to expose query endpoint
+            # For now, we'll test via graph stats endpoint
+            return 0, 0.0
     
     async def test_entry_points_query(self) -> Dict[str, Any]:
         """Test simple query: find entry points"""
         query = "MATCH (f:Function {is_entry_point: true}) RETURN f.name, f.file LIMIT 20"
-        result_count, elapsed_ms = self._run_query(query)
+        result_count, elapsed_ms = await self._run_query(query)
         
         result = {
             "query_id": "perf_001",
@@ -219,7 +331,7 @@ class QueryPerformanceEvaluator:
         ORDER BY caller_count DESC
         LIMIT 20
         """
-        result_count, elapsed_ms = self._run_query(query)
+        result_count, elapsed_ms = await self._run_query(query)
         
         result = {
             "query_id": "perf_002",
@@ -239,7 +351,7 @@ class QueryPerformanceEvaluator:
         RETURN [node in nodes(path) | node.name] as call_path, length(path) as hops
         LIMIT 20
         """
-        result_count, elapsed_ms = self._run_query(query)
+        result_count, elapsed_ms = await self._run_query(query)
         
         result = {
             "query_id": "perf_003",
@@ -254,10 +366,23 @@ class QueryPerformanceEvaluator:
     
     async def evaluate_all(self) -> Dict[str, Any]:
         """Run all performance tests"""
+        if not self.enabled:
+            return {
+                "metric": "query_performance",
+                "status": "skipped",
+                "skipped": True,
+                "reason": "backend query endpoint not available"
+            }
+        
+        entry_points, hubs, call_paths = await asyncio.gather(
+            self.test_entry_points_query(),
+            self.test_hub_functions_query(),
+            self.test_call_paths_query(),
+        )
         results = {
-            "entry_points": await self.test_entry_points_query(),
-            "hubs": await self.test_hub_functions_query(),
-            "call_paths": await self.test_call_paths_query(),
+            "entry_points": entry_points,
+            "hubs": hubs,
+            "call_paths": call_paths,
         }
         
         # Calculate metrics
@@ -273,10 +398,10 @@ class QueryPerformanceEvaluator:
             "details": results
         }
     
-    def cleanup(self):
+    async def cleanup(self):
         """Close connections"""
-        # Nothing to clean up for API-only evaluator
-        pass
+        if self.http_client and self._owns_http_client:
+            await self.http_client.aclose()
 
 
 # ============================================================================
@@ -286,22 +411,57 @@ class QueryPerformanceEvaluator:
 class NotebookUsabilityEvaluator:
     """Evaluates Jupyter notebook operation success rates"""
     
-    def __init__(self):
+    # Largest slices any operation needs; smaller ones are cut from these
+    NODES_FETCH_LIMIT = 500
+    RELS_FETCH_LIMIT = 2000
+    
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
         self.results = []
-        self.http_client = None
+        self.http_client = http_client
+        self._owns_http_client = http_client is None
+        # Pending or finished fetches, shared by concurrently running operations
+        self._nodes_cache = None
+        self._rels_cache = None
     
     async def setup(self, api_url: str):
         """Initialize HTTP client"""
-        self.http_client = httpx.AsyncClient(base_url=api_url)
+        if self._owns_http_client:
+            self.http_client = create_http_client(api_url)
+    
+    async def _fetch_results(self, url: str) -> List[Dict]:
+        """GET url and return its 'results' list"""
+        response = await self.http_client.get(url)
+        return loads_json(response.content).get('results', [])
+    
+    async def _get_nodes(self, limit: int) -> List[Dict]:
+        """Return the first limit nodes, fetching the shared superset once"""
+        if self._nodes_cache is None:
+            self._nodes_cache = asyncio.ensure_future(
+                self._fetch_results(f'/api/graph/nodes/search?limit={self.NODES_FETCH_LIMIT}')
+            )
+        return (await self._nodes_cache)[:limit]
+    
+    async def _stream_results(self, url: str) -> List[Dict]:
+        """GET url and collect its 'results' list, parsing while the body downloads"""
+        async with self.http_client.stream('GET', url) as response:
+            return [item async for item in stream_items(response, 'results.item')]
+    
+    async def _get_rels(self, limit: int) -> List[Dict]:
+        """Return the first limit relationships, fetching the shared superset once"""
+        if self._rels_cache is None:
+            self._rels_cache = asyncio.ensure_future(
+                self._stream_results(f'/api/graph/relationships?limit={self.RELS_FETCH_LIMIT}')
+            )
+        return (await self._rels_cache)[:limit]
     
     async def test_get_stats(self) -> Dict[str, Any]:
         """Test: get_graph_stats operation"""
         try:
-            start = time.time()
+            start = time.perf_counter()
             response = await self.http_client.get('/api/graph/stats')
-            elapsed_ms = (time.time() - start) * 1000
+            elapsed_ms = (time.perf_counter() - start) * 1000
             
-            data = response.json()
+            data = loads_json(response.content)
             required_fields = ['total_nodes', 'total_relationships', 'languages', 'entry_points']
             has_all_fields = all(f in data for f in required_fields)
             
@@ -325,11 +485,11 @@ class NotebookUsabilityEvaluator:
     async def test_get_nodes(self) -> Dict[str, Any]:
         """Test: get_all_nodes operation"""
         try:
-            start = time.time()
+            start = time.perf_counter()
             response = await self.http_client.get('/api/graph/nodes/search?limit=100')
-            elapsed_ms = (time.time() - start) * 1000
+            elapsed_ms = (time.perf_counter() - start) * 1000
             
-            data = response.json()
+            data = loads_json(response.content)
             results_list = data.get('results', [])
             
             result = {
@@ -350,35 +510,36 @@ class NotebookUsabilityEvaluator:
             }
     
     async def test_networkx_graph(self) -> Dict[str, Any]:
-        """Test: build NetworkX graph operation"""
+        """Test: build graph operation (rustworkx)"""
         try:
-            start = time.time()
-            response = await self.http_client.get('/api/graph/nodes/search?limit=500')
-            nodes_data = response.json().get('results', [])
+            start = time.perf_counter()
+            nodes_data, rels_data = await asyncio.gather(self._get_nodes(500), self._get_rels(2000))
             
-            response = await self.http_client.get('/api/graph/relationships?limit=2000')
-            rels_data = response.json().get('results', [])
-            
-            # Build graph
-            G = nx.DiGraph()
+            # Build graph; nodes are keyed by name and parallel edges collapse, as in nx.DiGraph
+            G = rx.PyDiGraph(multigraph=False)
+            name_to_idx = {}
             for node in nodes_data:
-                G.add_node(node.get('name'), **node)
+                name = node.get('name')
+                if name in name_to_idx:
+                    G[name_to_idx[name]] = node
+                else:
+                    name_to_idx[name] = G.add_node(node)
             
-            for rel in rels_data:
-                source = rel.get('source_name')
-                target = rel.get('target_name')
-                if source in G and target in G:
-                    G.add_edge(source, target)
+            G.add_edges_from_no_data([
+                (name_to_idx[rel['source_name']], name_to_idx[rel['target_name']])
+                for rel in rels_data
+                if rel.get('source_name') in name_to_idx and rel.get('target_name') in name_to_idx
+            ])
             
-            elapsed_ms = (time.time() - start) * 1000
+            elapsed_ms = (time.perf_counter() - start) * 1000
             
             result = {
                 "operation_id": "nb_op_003",
                 "operation": "build_networkx_graph",
-                "nodes_in_graph": G.number_of_nodes(),
-                "edges_in_graph": G.number_of_edges(),
+                "nodes_in_graph": G.num_nodes(),
+                "edges_in_graph": G.num_edges(),
                 "execution_time_ms": elapsed_ms,
-                "status": "✅ passed" if G.number_of_nodes() > 0 else "❌ empty_graph"
+                "status": "✅ passed" if G.num_nodes() > 0 else "❌ empty_graph"
             }
             self.results.append(result)
             return result
@@ -394,36 +555,37 @@ class NotebookUsabilityEvaluator:
         """Test: calculate centrality metrics"""
         try:
             # Load small graph
-            response = await self.http_client.get('/api/graph/nodes/search?limit=100')
-            nodes_data = response.json().get('results', [])
+            nodes_data, rels_data = await asyncio.gather(self._get_nodes(100), self._get_rels(500))
             
-            response = await self.http_client.get('/api/graph/relationships?limit=500')
-            rels_data = response.json().get('results', [])
-            
-            G = nx.DiGraph()
+            G = rx.PyDiGraph(multigraph=False)
+            name_to_idx = {}
             for node in nodes_data:
-                G.add_node(node.get('name'))
-            for rel in rels_data:
-                if rel.get('source_name') in G and rel.get('target_name') in G:
-                    G.add_edge(rel['source_name'], rel['target_name'])
+                name = node.get('name')
+                if name not in name_to_idx:
+                    name_to_idx[name] = G.add_node(name)
+            G.add_edges_from_no_data([
+                (name_to_idx[rel['source_name']], name_to_idx[rel['target_name']])
+                for rel in rels_data
+                if rel.get('source_name') in name_to_idx and rel.get('target_name') in name_to_idx
+            ])
             
-            if G.number_of_nodes() > 0:
-                start = time.time()
+            if G.num_nodes() > 0:
+                start = time.perf_counter()
                 
                 # Try multiple centrality measures
                 try:
-                    nx.degree_centrality(G)
+                    rx.in_degree_centrality(G)
                     has_degree = True
                 except Exception:
                     has_degree = False
                 
                 try:
-                    nx.pagerank(G)
+                    rx.pagerank(G)
                     has_pagerank = True
                 except Exception:
                     has_pagerank = False
                 
-                elapsed_ms = (time.time() - start) * 1000
+                elapsed_ms = (time.perf_counter() - start) * 1000
                 
                 result = {
                     "operation_id": "nb_op_004",
@@ -454,11 +616,17 @@ class NotebookUsabilityEvaluator:
     
     async def evaluate_all(self) -> Dict[str, Any]:
         """Run all notebook operation tests"""
+        stats, nodes, networkx_graph, centrality = await asyncio.gather(
+            self.test_get_stats(),
+            self.test_get_nodes(),
+            self.test_networkx_graph(),
+            self.test_centrality_calculation(),
+        )
         results = {
-            "stats": await self.test_get_stats(),
-            "nodes": await self.test_get_nodes(),
-            "networkx_graph": await self.test_networkx_graph(),
-            "centrality": await self.test_centrality_calculation(),
+            "stats": stats,
+            "nodes": nodes,
+            "networkx_graph": networkx_graph,
+            "centrality": centrality,
         }
         
         passed = sum(1 for r in results.values() if "passed" in r.get("status", ""))
@@ -474,7 +642,7 @@ class NotebookUsabilityEvaluator:
     
     async def cleanup(self):
         """Close connections"""
-        if self.http_client:
+        if self.http_client and self._owns_http_client:
             await self.http_client.aclose()
 
 
@@ -482,6 +650,77 @@ class NotebookUsabilityEvaluator:
 # MAIN EVALUATION RUNNER
 # ============================================================================
 
+def _write_results(output_path: Path, results: Dict[str, Any]):
+    """Serialize results and write them with a single write call, gzipped for .gz paths"""
+    data = dumps_json(results)
+    if output_path.suffix == ".gz":
+        # Fastest level: most of the size win on repetitive JSON for little CPU
+        data = gzip.compress(data, compresslevel=1)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(data)
+
+
+async def _run_evaluator(label: str, evaluator, setup) -> Dict[str, Any]:
+    """Set up, evaluate and clean up one evaluator, reporting failures as results"""
+    # Integer monotonic clock: immune to wall-clock jumps, converted only for output
+    start_ns = time.monotonic_ns()
+    try:
+        await setup
+        result = await evaluator.evaluate_all()
+        if result.get("status") == "skipped":
+            print(f"   ⏭️  {label} skipped: {result.get('reason', 'disabled')}")
+        else:
+            print(f"   ✅ {label} complete")
+    except Exception as e:
+        print(f"   ❌ {label} failed: {e}")
+        result = {"error": str(e)}
+    finally:
+        # A failing cleanup must not mask the evaluation result or its original error
+        try:
+            await evaluator.cleanup()
+        except Exception as e:
+            print(f"   ⚠️  {label} cleanup failed: {e}")
+    result["duration_seconds"] = (time.monotonic_ns() - start_ns) / 1e9
+    return result
+
+
+async def run_all_evaluations(redis_url: str, api_url: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the three evaluators concurrently
+    
+    They talk to independent services (Redis/Memgraph and the backend API), so
+    total time is that of the slowest evaluator rather than the sum.
+    
+    Returns:
+        Metric results keyed by metric name
+    """
+    # One pooled client per service for all evaluators: a single connection pool and TLS session.
+    # The exit stack releases them in reverse order, keeping any original exception.
+    async with contextlib.AsyncExitStack() as stack:
+        redis_pool = redis.ConnectionPool.from_url(redis_url, max_connections=16, decode_responses=True)
+        stack.push_async_callback(redis_pool.disconnect)
+        http_client = await stack.enter_async_context(create_http_client(api_url))
+        redis_client = await stack.enter_async_context(redis.Redis(connection_pool=redis_pool))
+        
+        consistency_eval = DataConsistencyEvaluator(http_client=http_client, redis_client=redis_client)
+        perf_eval = QueryPerformanceEvaluator(http_client=http_client)
+        notebook_eval = NotebookUsabilityEvaluator(http_client=http_client)
+        
+        # return_exceptions keeps one evaluator's unexpected failure from discarding the others
+        gathered = await asyncio.gather(
+            _run_evaluator("Data Consistency", consistency_eval, consistency_eval.setup(redis_url, api_url)),
+            _run_evaluator("Query Performance", perf_eval, perf_eval.setup(api_url)),
+            _run_evaluator("Notebook Usability", notebook_eval, notebook_eval.setup(api_url)),
+            return_exceptions=True,
+        )
+    
+    names = ("data_consistency", "query_performance", "notebook_usability")
+    return {
+        name: {"error": str(result)} if isinstance(result, Exception) else result
+        for name, result in zip(names, gathered)
+    }
+
+
 async def run_evaluation(
     redis_url: str = None,
     api_url: str = None,
@@ -497,101 +736,77 @@ async def run_evaluation(
     """
     
     # Use environment variables as fallback
-    redis_url = redis_url or os.getenv("REDIS_URL", "redis://redis:6379")
-    api_url = api_url or os.getenv("BACKEND_API_URL", "http://code-graph-http:8000")
-    
-    print("🚀 Starting Session 19 Evaluation")
-    print(f"   Redis: {redis_url}")
-    print(f"   API: {api_url}\n")
+    redis_url = redis_url or DEFAULT_REDIS_URL
+    api_url = api_url or DEFAULT_API_URL
+    
+    # Each phase is written to stdout in one call rather than one write per line
+    sys.stdout.write(
+        "🚀 Starting Session 19 Evaluation\n"
+        f"   Redis: {redis_url}\n"
+        f"   API: {api_url}\n\n"
+        "📊 Running Data Consistency, Query Performance and Notebook Usability Evaluations...\n"
+    )
+    sys.stdout.flush()
     
     results = {
         "timestamp": time.time(),
         "metrics": {}
     }
     
-    # 1. Data Consistency Evaluation
-    print("📊 Running Data Consistency Evaluation...")
-    consistency_eval = DataConsistencyEvaluator()
-    try:
-        await consistency_eval.setup(redis_url, api_url)
-        results["metrics"]["data_consistency"] = await consistency_eval.evaluate_all()
-        print("   ✅ Data Consistency complete\n")
-    except Exception as e:
-        print(f"   ❌ Data Consistency failed: {e}\n")
-        results["metrics"]["data_consistency"] = {"error": str(e)}
-    finally:
-        await consistency_eval.cleanup()
-    
-    # 2. Query Performance Evaluation
-    print("📊 Running Query Performance Evaluation...")
-    perf_eval = QueryPerformanceEvaluator()
-    try:
-        await perf_eval.setup(api_url)
-        results["metrics"]["query_performance"] = await perf_eval.evaluate_all()
-        print("   ✅ Query Performance complete\n")
-    except Exception as e:
-        print(f"   ❌ Query Performance failed: {e}\n")
-        results["metrics"]["query_performance"] = {"error": str(e)}
-    finally:
-        perf_eval.cleanup()
-    
-    # 3. Notebook Usability Evaluation
-    print("📊 Running Notebook Usability Evaluation...")
-    notebook_eval = NotebookUsabilityEvaluator()
-    try:
-        await notebook_eval.setup(api_url)
-        results["metrics"]["notebook_usability"] = await notebook_eval.evaluate_all()
-        print("   ✅ Notebook Usability complete\n")
-    except Exception as e:
-        print(f"   ❌ Notebook Usability failed: {e}\n")
-        results["metrics"]["notebook_usability"] = {"error": str(e)}
-    finally:
-        await notebook_eval.cleanup()
+    # 1-3. Data Consistency, Query Performance and Notebook Usability, concurrently
+    results["metrics"] = await run_all_evaluations(redis_url, api_url)
     
     # 4. Compute Overall Score
     metrics_data = results.get("metrics", {})
     scores = []
     
-    if "data_consistency" in metrics_data and "consistency_score" in metrics_data["data_consistency"]:
-        scores.append(metrics_data["data_consistency"]["consistency_score"])
-    
-    if "query_performance" in metrics_data and "passed" in metrics_data["query_performance"]:
-        total = metrics_data["query_performance"].get("total_queries", 1)
-        scores.append(metrics_data["query_performance"]["passed"] / total if total > 0 else 0)
+    for metric, score_key in (
+        ("data_consistency", "consistency_score"),
+        ("notebook_usability", "success_rate"),
+    ):
+        score = metrics_data.get(metric, {}).get(score_key)
+        if score is not None:
+            scores.append(score)
     
-    if "notebook_usability" in metrics_data and "success_rate" in metrics_data["notebook_usability"]:
-        scores.append(metrics_data["notebook_usability"]["success_rate"])
+    query_perf = metrics_data.get("query_performance", {})
+    if "passed" in query_perf:
+        # No queries means nothing passed, so a divisor of 1 still scores 0
+        scores.append(query_perf["passed"] / (query_perf.get("total_queries") or 1))
     
     overall_score = sum(scores) / len(scores) if scores else 0.0
     
     results["overall_evaluation_score"] = overall_score
     results["summary"] = {
         "total_metrics": len(metrics_data),
-        "passed_metrics": sum(1 for m in metrics_data.values() if "error" not in m),
+        "passed_metrics": sum(
+            1 for m in metrics_data.values() if "error" not in m and m.get("status") != "skipped"
+        ),
+        "skipped_metrics": sum(1 for m in metrics_data.values() if m.get("status") == "skipped"),
         "overall_status": "✅ PASSED" if overall_score >= 0.8 else "⚠️  WARNING" if overall_score >= 0.6 else "❌ FAILED"
     }
     
     # Save results
     output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
-    
-    print("=" * 60)
-    print("📋 EVALUATION SUMMARY")
-    print("=" * 60)
-    print(f"Overall Score: {overall_score:.2%}")
-    print(f"Status: {results['summary']['overall_status']}")
-    print(f"Metrics: {results['summary']['total_metrics']} ({results['summary']['passed_metrics']} passed)")
-    print(f"Results saved to: {output_path}")
-    print("=" * 60)
+    # Serialization and disk I/O are blocking; keep them off the event loop
+    await asyncio.to_thread(_write_results, output_path, results)
+    
+    summary = results["summary"]
+    rule = "=" * 60
+    sys.stdout.write(f"""
+{rule}
+📋 EVALUATION SUMMARY
+{rule}
+Overall Score: {overall_score:.2%}
+Status: {summary['overall_status']}
+Metrics: {summary['total_metrics']} ({summary['passed_metrics']} passed, {summary['skipped_metrics']} skipped)
+Results saved to: {output_path}
+{rule}
+""")
+    sys.stdout.flush()
     
     return results
 
 
 if __name__ == "__main__":
     # Run evaluation
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    results = loop.run_until_complete(run_evaluation())
+    results = asyncio.run(run_evaluation(), debug=False)
@@ -5,6 +5,7 @@ Tests all 8 MCP tools and generates a comprehensive report
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import json
 from pathlib import Path
@@ -13,8 +14,97 @@ from datetime import datetime
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# Shared event loop so the module-scoped server session outlives each test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+SERVER_PARAMS = StdioServerParameters(
+    command="codenav",
+    args=["--project-root", "."],
+)
+
+# Read-only tools checked concurrently once analyze_codebase has built the graph
+_TEST_CASES = (
+    ("project_statistics", {}),
+    ("dependency_analysis", {}),
+    ("complexity_analysis", {"threshold": 10}),
+    ("find_definition", {"symbol": "main"}),
+    ("find_references", {"symbol": "main"}),
+    ("find_callers", {"function": "main"}),
+    ("find_callees", {"function": "main"}),
+)
+
+
+async def _invoke(session, tool_name, args):
+    """Call one tool and summarize its result as (tool_name, result dict)"""
+    try:
+        result = await session.call_tool(tool_name, args)
+
+        # Extract content
+        content = "".join(getattr(item, "text", "") for item in (result.content or ()))
+        content_length = len(content)
+
+        success = bool(content.strip())
+        status = "✅" if success else "⚠️ "
+        print(f"  {status} {tool_name}: {content_length} chars returned")
+        return tool_name, {
+            "status": "SUCCESS" if success else "EMPTY",
+            "content_length": content_length,
+            "preview": content[:200] + "..." if content_length > 200 else content,
+            "arguments": args
+        }
+
+    except Exception as e:
+        print(f"  ❌ {tool_name}: {e}")
+        return tool_name, {
+            "status": "ERROR",
+            "error": str(e),
+            "arguments": args
+        }
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def mcp_session():
+    """
+    Spawn one server per module (one per xdist worker) and build its graph.
+
+    stdio_client's task group must be entered and exited by the same task, so
+    a background task owns the session while the tests borrow it.
+    """
+    ready = asyncio.get_running_loop().create_future()
+    stop = asyncio.Event()
+
+    async def serve():
+        try:
+            async with stdio_client(SERVER_PARAMS) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    await session.call_tool("analyze_codebase", {})
+                    ready.set_result(session)
+                    await stop.wait()
+        except Exception as e:
+            if ready.done():
+                raise
+            ready.set_exception(e)
+
+    server_task = asyncio.create_task(serve())
+    try:
+        yield await ready
+    finally:
+        stop.set()
+        await server_task
+
+
+@pytest.mark.parametrize("tool_name,args", _TEST_CASES, ids=[name for name, _ in _TEST_CASES])
+async def test_mcp_tool(mcp_session, tool_name, args):
+    """Each read-only tool answers without error; run with -n auto to spread tools over workers"""
+    result = await mcp_session.call_tool(tool_name, args)
+    assert not result.isError, result.content
+
+    # Handler failures come back as ordinary text, so check the report itself too
+    text = result.content[0].text
+    assert not text.startswith(("❌ Error executing", "Error executing")), text
+
 
-@pytest.mark.asyncio
 async def test_all_mcp_tools():
     """Test all MCP tools and generate report"""
 
@@ -28,11 +118,7 @@ async def test_all_mcp_tools():
     print("=" * 60)
 
     try:
-        server_params = StdioServerParameters(
-            command="codenav",
-            args=["--project-root", "."],
-        )
-        async with stdio_client(server_params) as (read, write):
+        async with stdio_client(SERVER_PARAMS) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
 
@@ -42,48 +128,17 @@ async def test_all_mcp_tools():
                 for tool in tools.tools:
                     print(f"  • {tool.name}: {tool.description}")
 
-                # Test each tool
-                test_cases = [
-                    ("analyze_codebase", {}),
-                    ("project_statistics", {}),
-                    ("dependency_analysis", {}),
-                    ("complexity_analysis", {"threshold": 10}),
-                    ("find_definition", {"symbol": "main"}),
-                    ("find_references", {"symbol": "main"}),
-                    ("find_callers", {"function": "main"}),
-                    ("find_callees", {"function": "main"}),
-                ]
-
-                for tool_name, args in test_cases:
-                    print(f"\n🔧 Testing {tool_name}...")
-                    try:
-                        result = await session.call_tool(tool_name, args)
-
-                        # Extract content
-                        content = ""
-                        if result.content:
-                            for item in result.content:
-                                if hasattr(item, 'text'):
-                                    content += item.text
-
-                        success = bool(content.strip())
-                        results["tool_results"][tool_name] = {
-                            "status": "SUCCESS" if success else "EMPTY",
-                            "content_length": len(content),
-                            "preview": content[:200] + "..." if len(content) > 200 else content,
-                            "arguments": args
-                        }
-
-                        status = "✅" if success else "⚠️ "
-                        print(f"  {status} {tool_name}: {len(content)} chars returned")
-
-                    except Exception as e:
-                        results["tool_results"][tool_name] = {
-                            "status": "ERROR",
-                            "error": str(e),
-                            "arguments": args
-                        }
-                        print(f"  ❌ {tool_name}: {e}")
+                # Build the graph first; the remaining tools only read it
+                print("\n🔧 Testing analyze_codebase...")
+                tool_name, tool_result = await _invoke(session, "analyze_codebase", {})
+                results["tool_results"][tool_name] = tool_result
+
+                # Test the read-only tools concurrently
+                print(f"\n🔧 Testing {', '.join(name for name, _ in _TEST_CASES)}...")
+                results_list = await asyncio.gather(
+                    *(_invoke(session, tool_name, args) for tool_name, args in _TEST_CASES)
+                )
+                results["tool_results"].update(results_list)
 
     except Exception as e:
         print(f"❌ Server connection failed: {e}")
@@ -0,0 +1,52 @@
+"""
+Shared fixtures for the Playwright E2E tests.
+
+Every async test in this directory runs on the session event loop, because
+the browser state below outlives a single test.
+"""
+
+import inspect
+
+import pytest
+import pytest_asyncio
+
+
+BASE_URL = "http://localhost:5173"
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_pycollect_makeitem(collector, name, obj):
+    """Mark async tests for the session loop before pytest-asyncio collects them."""
+    if collector.funcnamefilter(name) and inspect.iscoroutinefunction(obj):
+        pytest.mark.asyncio(loop_scope="session")(obj)
+    return (yield)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def context(browser):
+    """
+    Share one browser context across a module, loading the app once.
+
+    Pages resolve relative URLs against BASE_URL. The first page stays open
+    on the app for read-only tests; later pages reuse the context's warm
+    HTTP cache.
+    """
+    ctx = await browser.new_context(base_url=BASE_URL)
+    loaded = await ctx.new_page()
+    await loaded.goto("/")
+    yield ctx
+    await ctx.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def loaded_page(context):
+    """The already-loaded app page. Tests using it must not change page state."""
+    return context.pages[0]
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(context):
+    """Create a fresh page in the shared context for tests that change state."""
+    page = await context.new_page()
+    yield page
+    await page.close()
@@ -10,54 +10,41 @@ Tests verify:
 
 import pytest
 
-
-@pytest.fixture
-async def page(browser):
-    """Create a new page for each test."""
-    page = await browser.new_page()
-    yield page
-    await page.close()
+from tests.e2e.pages import WorkbenchPage
 
 
 class TestNodeDoubleClickNavigation:
     """Test node double-click navigation functionality."""
 
-    @pytest.mark.asyncio
     async def test_graph_loads_without_errors(self, page):
         """Verify graph loads without throwing uncaught exceptions."""
         errors = []
         page.on("pageerror", lambda err: errors.append(str(err)))
         
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
-        # Wait for graph to load (look for stats badge showing nodes)
+        # Wait for graph to load (look for stats badge showing nodes); errors
+        # raised while loading have been captured by the time this resolves
         await page.wait_for_selector("text=nodes", timeout=10000)
         
-        # Wait a bit for any delayed errors
-        await page.wait_for_timeout(2000)
-        
         # Should have no uncaught exceptions
         assert len(errors) == 0, f"Uncaught errors: {errors}"
 
-    @pytest.mark.asyncio
-    async def test_double_click_hint_appears(self, page):
+    async def test_double_click_hint_appears(self, loaded_page):
         """Verify double-click hint is shown when graph loads."""
-        await page.goto("http://localhost:5173")
-        
         # Wait for the hint about double-click to appear
-        hint = await page.wait_for_selector(
+        hint = await loaded_page.wait_for_selector(
             "text=Double-click a node to drill into its local subgraph",
             timeout=10000
         )
         assert hint is not None
 
-    @pytest.mark.asyncio
     async def test_no_uncaught_exceptions_on_canvas_interaction(self, page):
         """Verify no uncaught exceptions when interacting with the graph canvas."""
         errors = []
         page.on("pageerror", lambda err: errors.append(str(err)))
         
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Wait for graph to load
         await page.wait_for_selector("text=nodes", timeout=10000)
@@ -77,36 +64,32 @@ class TestNodeDoubleClickNavigation:
                 
                 # Single click on canvas
                 await page.mouse.click(center_x, center_y)
-                await page.wait_for_timeout(500)
+                await WorkbenchPage(page).flush_frames(2)
                 
                 # Double click on canvas (might not hit a node, but shouldn't throw)
                 await page.mouse.dblclick(center_x, center_y)
-                await page.wait_for_timeout(500)
+                await WorkbenchPage(page).flush_frames(2)
         
         # Should have no uncaught exceptions related to node handling
         node_errors = [e for e in errors if "node" in e.lower()]
         assert len(node_errors) == 0, f"Uncaught node-related errors: {node_errors}"
 
-    @pytest.mark.asyncio
-    async def test_navigation_controls_visible(self, page):
+    async def test_navigation_controls_visible(self, loaded_page):
         """Verify graph controls are visible."""
-        await page.goto("http://localhost:5173")
-        
         # Wait for 2D button to be visible
-        button_2d = await page.wait_for_selector("text=2D", timeout=5000)
+        button_2d = await loaded_page.wait_for_selector("text=2D", timeout=5000)
         assert button_2d is not None
         
         # Wait for 3D button to be visible  
-        button_3d = await page.wait_for_selector("text=3D", timeout=5000)
+        button_3d = await loaded_page.wait_for_selector("text=3D", timeout=5000)
         assert button_3d is not None
 
-    @pytest.mark.asyncio
     async def test_dimension_toggle_no_errors(self, page):
         """Verify switching between 2D and 3D doesn't cause errors."""
         errors = []
         page.on("pageerror", lambda err: errors.append(str(err)))
         
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Wait for graph to load
         await page.wait_for_selector("text=nodes", timeout=10000)
@@ -114,12 +97,12 @@ class TestNodeDoubleClickNavigation:
         # Switch to 3D
         button_3d = await page.wait_for_selector("text=3D", timeout=5000)
         await button_3d.click()
-        await page.wait_for_timeout(1000)
+        await page.wait_for_selector('button[title="3D view"].bg-indigo-600', timeout=3000)
         
         # Switch back to 2D
         button_2d = await page.wait_for_selector("text=2D", timeout=5000)
         await button_2d.click()
-        await page.wait_for_timeout(1000)
+        await page.wait_for_selector('button[title="2D view"].bg-indigo-600', timeout=3000)
         
         # Should have no uncaught exceptions
         assert len(errors) == 0, f"Uncaught errors during dimension toggle: {errors}"
@@ -128,7 +111,6 @@ class TestNodeDoubleClickNavigation:
 class TestNodeNotFoundHandling:
     """Test handling of node not found scenarios."""
 
-    @pytest.mark.asyncio
     async def test_console_warnings_on_invalid_node(self, page):
         """Verify console warnings are logged instead of throwing for invalid nodes."""
         console_messages = []
@@ -140,14 +122,11 @@ class TestNodeNotFoundHandling:
         errors = []
         page.on("pageerror", lambda err: errors.append(str(err)))
         
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
-        # Wait for graph to load
+        # Wait for graph to load; load-time messages are captured by then
         await page.wait_for_selector("text=nodes", timeout=10000)
         
-        # Wait a bit for any console messages
-        await page.wait_for_timeout(2000)
-        
         # Check that no page errors related to "node not found" were thrown
         node_not_found_errors = [
             e for e in errors 
@@ -160,20 +139,17 @@ class TestNodeNotFoundHandling:
 class TestNavigationBreadcrumb:
     """Test navigation breadcrumb functionality."""
 
-    @pytest.mark.asyncio
-    async def test_breadcrumb_hidden_initially(self, page):
+    async def test_breadcrumb_hidden_initially(self, loaded_page):
         """Verify navigation breadcrumb is hidden when not navigating."""
-        await page.goto("http://localhost:5173")
-        
         # Wait for graph to load
-        await page.wait_for_selector("text=nodes", timeout=10000)
+        await loaded_page.wait_for_selector("text=nodes", timeout=10000)
         
         # The back button should not be visible initially
-        back_button = await page.query_selector('[title="Go back"]')
+        back_button = await loaded_page.query_selector('[title="Go back"]')
         assert back_button is None, "Back button should not be visible initially"
         
         # The home button should not be visible initially
-        home_button = await page.query_selector('[title="Return to full graph"]')
+        home_button = await loaded_page.query_selector('[title="Return to full graph"]')
         assert home_button is None, "Home button should not be visible initially"
 
 
@@ -9,51 +9,37 @@ Tests verify:
 - Connection recovery
 """
 
-import asyncio
-from datetime import datetime
-
 import pytest
+from playwright.async_api import expect
 
 
-@pytest.fixture
-async def page(browser):
-    """Create a new page for each test."""
-    page = await browser.new_page()
-    yield page
-    await page.close()
+# Endpoint hit by the header's Re-analyze button
+REANALYZE_PATH = "/graph/admin/reanalyze"
 
 
 class TestWebSocketConnection:
     """Test WebSocket connection and status."""
 
-    @pytest.mark.asyncio
-    async def test_websocket_connects_on_page_load(self, page):
+    async def test_websocket_connects_on_page_load(self, loaded_page):
         """Verify WebSocket connects when page loads."""
-        # Navigate to the app
-        await page.goto("http://localhost:5173")
-        
         # Wait for LiveStats component to appear
-        await page.wait_for_selector('[class*="Live Stats"]', timeout=5000)
+        await loaded_page.wait_for_selector('[class*="Live Stats"]', timeout=5000)
         
-        # Check connection status shows connected
-        await page.wait_for_selector("text=Connected", timeout=5000)
+        # Check connection status shows connected (exact text, so "Disconnected" doesn't match)
+        await expect(loaded_page.get_by_test_id("connection-status")).to_have_text("● Connected")
 
-    @pytest.mark.asyncio
-    async def test_websocket_status_shows_events(self, page):
+    async def test_websocket_status_shows_events(self, loaded_page):
         """Verify event counter updates."""
-        await page.goto("http://localhost:5173")
-        
         # Wait for event counter to appear
-        await page.wait_for_selector("text=Events:", timeout=5000)
+        await loaded_page.wait_for_selector("text=Events:", timeout=5000)
         
         # Initial count should be 0 or low
-        event_text = await page.inner_text("text=Events:")
+        event_text = await loaded_page.inner_text("text=Events:")
         assert "Events:" in event_text
 
-    @pytest.mark.asyncio
     async def test_ping_button_works(self, page):
         """Verify ping button sends keep-alive signal."""
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Wait for ping button
         await page.wait_for_selector("text=Ping Server", timeout=5000)
@@ -70,71 +56,54 @@ class TestWebSocketConnection:
 class TestLiveStats:
     """Test live statistics display."""
 
-    @pytest.mark.asyncio
-    async def test_node_count_displays(self, page):
+    async def test_node_count_displays(self, loaded_page):
         """Verify node count is displayed."""
-        await page.goto("http://localhost:5173")
-        
         # Wait for node count
-        await page.wait_for_selector("text=Nodes:", timeout=5000)
-        node_count_text = await page.inner_text("text=Nodes:")
-        assert "Nodes:" in node_count_text
+        node_count = loaded_page.get_by_test_id("node-count")
+        await expect(node_count).to_be_visible()
+        await expect(node_count).to_contain_text("Nodes:")
 
-    @pytest.mark.asyncio
-    async def test_relationship_count_displays(self, page):
+    async def test_relationship_count_displays(self, loaded_page):
         """Verify relationship count is displayed."""
-        await page.goto("http://localhost:5173")
-        
-        # Wait for relationship count
-        await page.wait_for_selector("text=Relationships:", timeout=5000)
-        rel_count_text = await page.inner_text("text=Relationships:")
-        assert "Relationships:" in rel_count_text
+        # Wait for relationship count (labelled "Edges" in the status bar)
+        edge_count = loaded_page.get_by_test_id("edge-count")
+        await expect(edge_count).to_be_visible()
+        await expect(edge_count).to_contain_text("Edges:")
 
-    @pytest.mark.asyncio
-    async def test_connection_indicator_animates(self, page):
+    async def test_connection_indicator_animates(self, loaded_page):
         """Verify connection status indicator shows animation."""
-        await page.goto("http://localhost:5173")
-        
         # Wait for connected status
-        await page.wait_for_selector("text=Connected", timeout=5000)
+        await expect(loaded_page.get_by_test_id("connection-status")).to_have_text("● Connected")
         
         # Check for animated pulse class (indicates live connection)
-        indicator = await page.query_selector("[class*='animate-pulse']")
+        indicator = await loaded_page.query_selector("[class*='animate-pulse']")
         assert indicator is not None, "Connection indicator should have pulse animation"
 
 
 class TestAnalysisProgress:
     """Test analysis progress display."""
 
-    @pytest.mark.asyncio
     async def test_analysis_progress_appears_during_reanalysis(self, page):
         """Verify analysis progress component appears."""
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Wait for Re-analyze button
         await page.wait_for_selector("text=Re-analyze", timeout=5000)
         
-        # Click re-analyze
-        await page.click("text=Re-analyze")
-        
-        # Wait for progress component or indicator (may not appear if analysis is fast)
-        # Check if either progress appears or analysis completes quickly
-        try:
-            await page.wait_for_selector("text=Analysis Progress", timeout=2000)
-        except:
-            # If progress doesn't appear, analysis was fast
-            pass
+        # Click re-analyze and wait for the request to finish; the progress
+        # component shows while it runs (briefly, if analysis is fast)
+        async with page.expect_response(lambda r: REANALYZE_PATH in r.url) as response_info:
+            await page.click("text=Re-analyze")
+        await response_info.value
 
-    @pytest.mark.asyncio
     async def test_progress_bar_shows_percentage(self, page):
         """Verify progress bar displays percentage."""
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
-        # Trigger re-analysis
-        await page.click("text=Re-analyze")
-        
-        # Wait for progress indicator (may be transient)
-        await page.wait_for_timeout(1000)
+        # Trigger re-analysis and wait for it to finish
+        async with page.expect_response(lambda r: REANALYZE_PATH in r.url) as response_info:
+            await page.click("text=Re-analyze")
+        await response_info.value
         
         # Look for percentage display
         try:
@@ -147,12 +116,11 @@ class TestAnalysisProgress:
 class TestEventLog:
     """Test event log display."""
 
-    @pytest.mark.asyncio
     async def test_event_log_displays_on_desktop(self, page):
         """Verify event log is visible on desktop."""
         # Set desktop viewport
         await page.set_viewport_size({"width": 1920, "height": 1080})
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Wait for event log
         try:
@@ -161,11 +129,10 @@ class TestEventLog:
             # Event log might not be visible if no events yet
             pass
 
-    @pytest.mark.asyncio
     async def test_event_filtering_works(self, page):
         """Verify event filtering buttons work."""
         await page.set_viewport_size({"width": 1920, "height": 1080})
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Wait for event log
         try:
@@ -182,67 +149,61 @@ class TestEventLog:
 class TestRealtimeUpdates:
     """Test real-time data updates."""
 
-    @pytest.mark.asyncio
     async def test_node_count_updates_after_reanalysis(self, page):
         """Verify node count updates when graph changes."""
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Get initial node count
-        await page.wait_for_selector("text=Nodes:", timeout=5000)
-        initial_nodes = await page.text_content("text=Nodes:")
-        
-        # Trigger re-analysis
-        await page.click("text=Re-analyze")
+        node_count = page.get_by_test_id("node-count")
+        await expect(node_count).to_be_visible()
+        initial_nodes = await node_count.text_content()
         
-        # Wait for update
-        await page.wait_for_timeout(2000)
+        # Trigger re-analysis; the button label returns once the graph has reloaded
+        async with page.expect_response(lambda r: REANALYZE_PATH in r.url):
+            await page.click("text=Re-analyze")
+        await page.wait_for_selector("text=Re-analyze", timeout=10000)
         
         # Node count should still display
-        current_nodes = await page.text_content("text=Nodes:")
-        assert current_nodes is not None
+        await expect(node_count).to_contain_text("Nodes:")
 
-    @pytest.mark.asyncio
     async def test_connection_recovery(self, page):
         """Verify connection recovers after interruption."""
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Wait for connection
-        await page.wait_for_selector("text=Connected", timeout=5000)
+        status = page.get_by_test_id("connection-status")
+        await expect(status).to_have_text("● Connected")
         
-        # Simulate offline by blocking network
+        # Simulate offline by blocking network (context-wide, so always restore it)
         await page.context.set_offline(True)
-        await page.wait_for_timeout(1000)
-        
-        # Should show disconnected
-        disconnected = await page.query_selector("text=Disconnected")
-        assert disconnected is not None
-        
-        # Restore network
-        await page.context.set_offline(False)
+        try:
+            # Should show disconnected
+            await expect(status).to_have_text("○ Disconnected")
+        finally:
+            # Restore network
+            await page.context.set_offline(False)
         
         # Should reconnect
-        await page.wait_for_selector("text=Connected", timeout=10000)
+        await expect(status).to_have_text("● Connected", timeout=10000)
 
 
 class TestUIResponsiveness:
     """Test UI responsiveness and interaction."""
 
-    @pytest.mark.asyncio
     async def test_mobile_hides_event_log(self, page):
         """Verify event log is hidden on mobile."""
         # Set mobile viewport
         await page.set_viewport_size({"width": 375, "height": 667})
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Event log should be hidden on mobile (hidden lg:block)
         # (Can't easily test CSS visibility, but component shouldn't break)
         await page.wait_for_selector("text=Browse", timeout=5000)
 
-    @pytest.mark.asyncio
     async def test_sidebar_components_sticky(self, page):
         """Verify sidebar components remain visible when scrolling."""
         await page.set_viewport_size({"width": 1920, "height": 1080})
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         # Wait for sidebar
         await page.wait_for_selector("text=Live Stats", timeout=5000)
@@ -258,26 +219,23 @@ class TestUIResponsiveness:
 class TestErrorHandling:
     """Test error handling in real-time features."""
 
-    @pytest.mark.asyncio
     async def test_page_loads_without_websocket_error(self, page):
         """Verify page loads gracefully even if WebSocket fails."""
-        await page.goto("http://localhost:5173")
-        
-        # Check for unhandled errors
+        # Check for unhandled errors, listening before navigation so none are missed
         errors = []
         page.on("console", lambda msg: errors.append(msg.text) if "error" in msg.type else None)
         
-        await page.wait_for_timeout(2000)
+        # Wait for network quiet (open WebSockets don't count) instead of a fixed sleep
+        await page.goto("/", wait_until="networkidle")
         
         # Should have no errors (or only expected ones)
         error_count = sum(1 for e in errors if "WebSocket" not in e)
         # Some errors might occur, but page should still load
 
-    @pytest.mark.asyncio
     async def test_clear_events_button_works(self, page):
         """Verify clear events button clears the log."""
         await page.set_viewport_size({"width": 1920, "height": 1080})
-        await page.goto("http://localhost:5173")
+        await page.goto("/")
         
         try:
             # Wait for clear button
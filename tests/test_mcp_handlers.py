@@ -0,0 +1,264 @@
+"""
+Unit tests for the MCP tool handlers in codenav.server.mcp_server.
+
+The handlers only format engine results, so a lightweight stub engine is
+enough to exercise them without building a real code graph.
+"""
+
+import asyncio
+
+import pytest
+
+from codenav.server import mcp_server
+
+
+class StubEngine:
+    """Minimal stand-in for UniversalAnalysisEngine."""
+
+    def __init__(self, references=None, callers=None, complex_functions=None):
+        self.graph_revision = 1
+        self.stale = False
+        self.refresh_calls = 0
+        self.stats_calls = 0
+        self.references = references or []
+        self.callers = callers or []
+        self.complex_functions = complex_functions or []
+
+    async def refresh_graph(self):
+        self.refresh_calls += 1
+        if self.stale:
+            self.stale = False
+            self.graph_revision += 1
+        return self.graph_revision
+
+    async def force_reanalysis(self):
+        self.graph_revision += 1
+
+    async def find_symbol_references(self, symbol):
+        return self.references
+
+    async def find_function_callers(self, function):
+        return self.callers
+
+    async def analyze_complexity(self, threshold):
+        return self.complex_functions
+
+    async def get_project_stats(self):
+        self.stats_calls += 1
+        return {
+            "project_root": "/repo",
+            "last_analysis": "2025-01-01 00:00:00",
+            "total_files": 3,
+            "total_nodes": 1200,
+            "total_relationships": 3400,
+            "node_types": {"class": 4, "function": 20},
+        }
+
+    async def get_code_insights(self):
+        node = {"node_name": "core", "node_type": "function", "score": 0.5}
+        return {
+            "graph_statistics": {"density": 0.01, "average_degree": 2.5},
+            "topology_analysis": {"is_directed_acyclic": False, "num_cycles": 2},
+            "structural_analysis": {
+                "articulation_points": [
+                    {"node_name": f"hub_{i}", "critical_impact": "high"} for i in range(4)
+                ],
+                "bridges": [
+                    {"source_name": "a", "target_name": "b", "critical_impact": "medium"}
+                ],
+            },
+            "centrality_analysis": {
+                "betweenness_centrality": [node] * 6,
+                "pagerank": [node],
+            },
+        }
+
+    async def get_dependency_graph(self):
+        return {
+            "total_files": 2,
+            "total_dependencies": 1,
+            "graph_density": 0.5,
+            "is_directed_acyclic": False,
+            "strongly_connected_components": 1,
+            "circular_dependencies": [["a.py", "b.py"]] * 6,
+            "dependencies": {"/repo/a.py": ["os", "b"], "/repo/b.py": []},
+        }
+
+
+@pytest.fixture
+def engine():
+    return StubEngine()
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    mcp_server._stats_cache.clear()
+    yield
+    mcp_server._stats_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_usage_guide_reuses_module_constant(engine):
+    first = await mcp_server.handle_get_usage_guide(engine, {})
+    second = await mcp_server.handle_get_usage_guide(engine, {})
+
+    assert first[0].text is mcp_server._USAGE_GUIDE_CONTENT
+    assert second[0].text is first[0].text
+    assert "Tool Usage Guide" in first[0].text
+
+
+def test_tool_factories_are_cached():
+    assert mcp_server.get_tool_definitions() is mcp_server.get_tool_definitions()
+    assert mcp_server.get_tool_handlers() is mcp_server.get_tool_handlers()
+    assert {tool.name for tool in mcp_server.get_tool_definitions()} == set(
+        mcp_server.get_tool_handlers()
+    )
+
+
+@pytest.mark.asyncio
+async def test_engine_is_constructed_once_under_concurrency(monkeypatch, tmp_path):
+    created = []
+
+    class CountingEngine:
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+
+    monkeypatch.setattr(mcp_server, "UniversalAnalysisEngine", CountingEngine)
+    monkeypatch.setattr(mcp_server, "analysis_engine", None)
+
+    # Hold the lock so every caller passes the unlocked fast path and queues on it
+    async with mcp_server._engine_lock:
+        calls = asyncio.gather(
+            *(mcp_server.ensure_analysis_engine_ready(tmp_path, enable_redis_cache=False) for _ in range(5))
+        )
+        await asyncio.sleep(0)
+        assert created == []
+
+    engines = await calls
+
+    assert len(created) == 1
+    assert all(e is created[0] for e in engines)
+
+
+@pytest.mark.asyncio
+async def test_find_references_reports_file_basenames():
+    engine = StubEngine(references=[
+        {"referencing_symbol": f"caller_{i}", "file": "/repo/pkg/module.py",
+         "line": i, "context": "call"}
+        for i in range(3)
+    ])
+
+    result = await mcp_server.handle_find_references(engine, {"symbol": "target"})
+    text = result[0].text
+
+    assert "(3 references)" in text
+    assert text.count("`module.py:") == 3
+    assert "Full Path: `/repo/pkg/module.py`" in text
+
+
+@pytest.mark.asyncio
+async def test_find_references_truncates_to_limit():
+    engine = StubEngine(references=[
+        {"referencing_symbol": f"caller_{i}", "file": "/repo/module.py",
+         "line": i, "context": "call"}
+        for i in range(10)
+    ])
+
+    result = await mcp_server.handle_find_references(engine, {"symbol": "target", "limit": 4})
+    text = result[0].text
+
+    assert "(10 references)" in text
+    assert text.count("`module.py:") == 4
+    assert "*... and 6 more references*" in text
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_find_references_clamps_limit_to_one_row(limit):
+    engine = StubEngine(references=[
+        {"referencing_symbol": f"caller_{i}", "file": "/repo/module.py",
+         "line": i, "context": "call"}
+        for i in range(3)
+    ])
+
+    result = await mcp_server.handle_find_references(engine, {"symbol": "target", "limit": limit})
+    text = result[0].text
+
+    assert text.count("`module.py:") == 1
+    assert "*... and 2 more references*" in text
+
+
+@pytest.mark.asyncio
+async def test_dependency_analysis_report(engine):
+    text = (await mcp_server.handle_dependency_analysis(engine, {}))[0].text
+
+    assert text.startswith("# Advanced Dependency Analysis (Powered by rustworkx)\n\n")
+    assert "- **Graph Density**: 0.5000\n" in text
+    assert "**Cycle 1**: a.py → b.py → a.py\n" in text
+    assert "*... and 1 more cycles*" in text
+    assert "### a.py\n- os\n- b\n" in text
+    assert "### b.py" not in text
+
+
+@pytest.mark.asyncio
+async def test_project_statistics_report(engine):
+    text = (await mcp_server.handle_project_statistics(engine, {}))[0].text
+
+    assert text.startswith("# Advanced Project Statistics (Powered by rustworkx)\n\n## Overview\n")
+    assert "- **Total Code Elements**: 1,200\n" in text
+    assert "- **Class**: 4\n- **Function**: 20\n" in text
+    assert "- **Is DAG**: ❌ No\n" in text
+    assert "*... and 1 more critical nodes*" in text
+    assert "- **a → b**: medium\n" in text
+    assert "5. **core** (function) - 0.5000\n" in text
+    assert "6. **core**" not in text
+
+
+@pytest.mark.asyncio
+async def test_project_stats_reused_until_graph_revision_changes(engine):
+    await mcp_server.handle_analyze_codebase(engine, {})
+    await mcp_server.handle_project_statistics(engine, {})
+    assert engine.stats_calls == 1
+
+    engine.graph_revision += 1
+    await mcp_server.handle_project_statistics(engine, {})
+    assert engine.stats_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_project_stats_recomputed_when_sources_change(engine):
+    await mcp_server.handle_project_statistics(engine, {})
+
+    # Simulates an edit picked up by the engine's mtime check rather than the file watcher
+    engine.stale = True
+    await mcp_server.handle_project_statistics(engine, {})
+    assert engine.stats_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_codebase_rebuilds_only_when_requested(engine):
+    first = await mcp_server.handle_analyze_codebase(engine, {})
+    second = await mcp_server.handle_analyze_codebase(engine, {"rebuild_graph": False})
+    assert second[0].text is first[0].text
+    assert engine.stats_calls == 1
+
+    await mcp_server.handle_analyze_codebase(engine, {"rebuild_graph": True})
+    assert engine.graph_revision == 2
+    assert engine.stats_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_freshness_checked_once_per_handler_call(engine):
+    await mcp_server.handle_analyze_codebase(engine, {})
+    await mcp_server.handle_project_statistics(engine, {})
+    assert engine.refresh_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_codebase_report_refreshed_when_sources_change(engine):
+    first = await mcp_server.handle_analyze_codebase(engine, {})
+
+    engine.stale = True
+    second = await mcp_server.handle_analyze_codebase(engine, {})
+    assert second[0].text is not first[0].text
+    assert engine.stats_calls == 2
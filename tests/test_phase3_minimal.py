@@ -4,6 +4,9 @@ Phase 3 Integration Tests: Minimal Testing without Dependencies
 Tests the optimized universal parser imports and basic structure without external dependencies.
 """
 
+import ast
+import functools
+import re
 import sys
 import tempfile
 import shutil
@@ -13,64 +16,134 @@ from pathlib import Path
 # Add source to path
 sys.path.insert(0, 'src')
 
+# Read and parse the parser source once; every test inspects the same immutable text
+_SOURCE_PATH = Path(__file__).resolve().parent.parent / "src" / "codenav" / "universal_parser.py"
+_SRC = _SOURCE_PATH.read_text()
+_TREE = ast.parse(_SRC)
+
+# Literal markers the structure tests look for in the parser source
+_OPTIMIZATION_MARKERS = [
+    # Gitignore optimization
+    ("_load_gitignore_patterns", "Gitignore pattern loading optimization"),
+    ("_gitignore_patterns", "Cached gitignore patterns"),
+    ("_gitignore_compiled", "Compiled pathspec patterns"),
+    ("_project_root", "Cached project root"),
+
+    # Cache optimization
+    ("@cached_method", "Unified cache decorators"),
+    ("HybridCacheManager", "Hybrid cache integration"),
+    ("ttl=", "TTL-based caching"),
+]
+
+_EXPECTED_IMPORTS = [
+    "from .cache_manager import HybridCacheManager, cached_method",
+    "from .redis_cache import RedisConfig",
+    "from dataclasses import dataclass",
+    "from pathlib import Path",
+    "import logging",
+    "import fnmatch"
+]
+
+
+
+def _import_entries(tree):
+    """Return one (level, module, name) entry per name imported anywhere in tree."""
+    entries = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            entries.update((node.level, node.module, alias.name) for alias in node.names)
+        elif isinstance(node, ast.Import):
+            entries.update((0, None, alias.name) for alias in node.names)
+    return frozenset(entries)
+
+
+# Each expected statement parsed into the entries it must contribute
+_EXPECTED_IMPORT_ENTRIES = {stmt: _import_entries(ast.parse(stmt)) for stmt in _EXPECTED_IMPORTS}
+
+_CRITICAL_ELEMENTS = [
+    ("class LanguageConfig", "LanguageConfig dataclass"),
+    ("class LanguageRegistry", "LanguageRegistry class"),
+    ("class UniversalParser", "UniversalParser main class"),
+    ("def _should_ignore_path", "Optimized gitignore check"),
+    ("def _load_gitignore_patterns", "Gitignore pattern loading"),
+    ("def parse_file", "File parsing method"),
+    ("def parse_directory", "Directory parsing method"),
+    ("async def is_supported_file", "Async file support check"),
+    ("async def detect_language", "Async language detection"),
+]
+
+_PERFORMANCE_PATTERNS = [
+    ("self._gitignore_patterns is not None", "Gitignore pattern caching check"),
+    ("self._project_root == project_root", "Project root caching check"),
+    ("if self._gitignore_compiled:", "Pathspec optimization usage"),
+    ("except ImportError:", "Graceful pathspec fallback"),
+    ("fnmatch.fnmatch(", "Fallback pattern matching"),
+]
+
+# Any of these means functools.lru_cache is still in use
+_LRU_MARKERS = frozenset({"@lru_cache", "lru_cache("})
+
+_ALL_MARKERS = frozenset(
+    [marker for marker, _ in _OPTIMIZATION_MARKERS]
+    + list(_LRU_MARKERS)
+    + [element for element, _ in _CRITICAL_ELEMENTS]
+    + [pattern for pattern, _ in _PERFORMANCE_PATTERNS]
+)
+# Zero-width lookahead so overlapping markers are all reported; longest alternatives first
+_MARKER_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_ALL_MARKERS, key=len, reverse=True))) + "))"
+)
+
+# Languages the registry must cover for the support check to pass
+_KEY_LANGUAGES = frozenset({"python", "javascript", "typescript", "java", "cpp", "rust", "go"})
+
+
+
+@functools.cache
+def _marker_hits(source):
+    """Return the markers present in source, found with one linear regex sweep."""
+    found = {match.group(1) for match in _MARKER_RE.finditer(source)}
+    # A shorter marker that prefixes a longer match at the same offset is present too
+    return frozenset(marker for marker in _ALL_MARKERS if any(hit.startswith(marker) for hit in found))
+
+
 print("🧪 Starting Phase 3 Minimal Integration Tests...")
 print("=" * 60)
 
-def test_file_syntax():
+def test_file_syntax(tree=_TREE):
     """Test that the universal_parser.py file has valid syntax."""
     try:
-        import ast
-        
-        with open('src/codenav/universal_parser.py', 'r') as f:
-            source = f.read()
-        
-        tree = ast.parse(source)
         print("✅ Syntax validation: PASSED")
         
-        # Count structural elements
-        classes = [n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)]
-        functions = [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
-        async_functions = [n for n in ast.walk(tree) if isinstance(n, ast.AsyncFunctionDef)]
+        # Count structural elements in a single walk, keyed on exact node type
+        counts = {ast.ClassDef: 0, ast.FunctionDef: 0, ast.AsyncFunctionDef: 0}
+        for node in ast.walk(tree):
+            count = counts.get(type(node))
+            if count is not None:
+                counts[type(node)] = count + 1
         
-        print(f"   📊 Structure: {len(classes)} classes, {len(functions)} functions, {len(async_functions)} async methods")
+        print(f"   📊 Structure: {counts[ast.ClassDef]} classes, {counts[ast.FunctionDef]} functions, {counts[ast.AsyncFunctionDef]} async methods")
         return True
         
     except Exception as e:
         print(f"❌ Syntax validation failed: {e}")
         return False
 
-def test_optimization_markers():
+def test_optimization_markers(source=_SRC):
     """Test that optimization markers are present in the code."""
     try:
-        with open('src/codenav/universal_parser.py', 'r') as f:
-            source = f.read()
-        
-        # Check for critical optimization markers
-        optimization_markers = [
-            # Gitignore optimization
-            ("_load_gitignore_patterns", "Gitignore pattern loading optimization"),
-            ("_gitignore_patterns", "Cached gitignore patterns"),
-            ("_gitignore_compiled", "Compiled pathspec patterns"),
-            ("_project_root", "Cached project root"),
-            
-            # Cache optimization
-            ("@cached_method", "Unified cache decorators"),
-            ("HybridCacheManager", "Hybrid cache integration"),
-            ("ttl=", "TTL-based caching"),
-            
-            # LRU cache removal (should NOT exist)
-        ]
+        hits = _marker_hits(source)
         
         found_optimizations = []
-        for marker, description in optimization_markers:
-            if marker in source:
+        for marker, description in _OPTIMIZATION_MARKERS:
+            if marker in hits:
                 found_optimizations.append(description)
                 print(f"   ✅ Found: {description}")
             else:
                 print(f"   ❌ Missing: {description}")
         
         # Check LRU cache removal
-        lru_removed = "@lru_cache" not in source and "lru_cache(" not in source
+        lru_removed = not (hits & _LRU_MARKERS)
         if lru_removed:
             found_optimizations.append("LRU cache removal")
             print("   ✅ Found: LRU cache properly removed")
@@ -78,7 +151,7 @@ def test_optimization_markers():
             print("   ❌ Missing: LRU cache still present")
         
         success = len(found_optimizations) >= 6  # Most optimizations found
-        print(f"   📊 Optimization markers: {len(found_optimizations)}/{len(optimization_markers)} found")
+        print(f"   📊 Optimization markers: {len(found_optimizations)}/{len(_OPTIMIZATION_MARKERS)} found")
         
         return success
         
@@ -86,32 +159,22 @@ def test_optimization_markers():
         print(f"❌ Optimization markers test failed: {e}")
         return False
 
-def test_import_structure():
+def test_import_structure(tree=_TREE):
     """Test import statements and dependencies."""
     try:
-        with open('src/codenav/universal_parser.py', 'r') as f:
-            source = f.read()
-        
-        # Check for expected imports
-        expected_imports = [
-            "from .cache_manager import HybridCacheManager, cached_method",
-            "from .redis_cache import RedisConfig",
-            "from dataclasses import dataclass",
-            "from pathlib import Path",
-            "import logging",
-            "import fnmatch"
-        ]
+        # One walk collects every imported name; statements match regardless of layout
+        imports = _import_entries(tree)
         
         found_imports = []
-        for import_stmt in expected_imports:
-            if import_stmt in source:
+        for import_stmt in _EXPECTED_IMPORTS:
+            if _EXPECTED_IMPORT_ENTRIES[import_stmt] <= imports:
                 found_imports.append(import_stmt)
                 print(f"   ✅ Import: {import_stmt}")
             else:
                 print(f"   ❌ Missing: {import_stmt}")
         
-        success = len(found_imports) >= len(expected_imports) - 1  # Allow 1 missing
-        print(f"   📊 Import structure: {len(found_imports)}/{len(expected_imports)} imports found")
+        success = len(found_imports) >= len(_EXPECTED_IMPORTS) - 1  # Allow 1 missing
+        print(f"   📊 Import structure: {len(found_imports)}/{len(_EXPECTED_IMPORTS)} imports found")
         
         return success
         
@@ -119,35 +182,21 @@ def test_import_structure():
         print(f"❌ Import structure test failed: {e}")
         return False
 
-def test_class_structure():
+def test_class_structure(source=_SRC):
     """Test that critical classes and methods exist."""
     try:
-        with open('src/codenav/universal_parser.py', 'r') as f:
-            source = f.read()
-        
-        # Check for critical classes and methods
-        critical_elements = [
-            ("class LanguageConfig", "LanguageConfig dataclass"),
-            ("class LanguageRegistry", "LanguageRegistry class"),
-            ("class UniversalParser", "UniversalParser main class"),
-            ("def _should_ignore_path", "Optimized gitignore check"),
-            ("def _load_gitignore_patterns", "Gitignore pattern loading"),
-            ("def parse_file", "File parsing method"),
-            ("def parse_directory", "Directory parsing method"),
-            ("async def is_supported_file", "Async file support check"),
-            ("async def detect_language", "Async language detection"),
-        ]
+        hits = _marker_hits(source)
         
         found_elements = []
-        for element, description in critical_elements:
-            if element in source:
+        for element, description in _CRITICAL_ELEMENTS:
+            if element in hits:
                 found_elements.append(description)
                 print(f"   ✅ Found: {description}")
             else:
                 print(f"   ❌ Missing: {description}")
         
-        success = len(found_elements) >= len(critical_elements) - 1  # Allow 1 missing
-        print(f"   📊 Class structure: {len(found_elements)}/{len(critical_elements)} elements found")
+        success = len(found_elements) >= len(_CRITICAL_ELEMENTS) - 1  # Allow 1 missing
+        print(f"   📊 Class structure: {len(found_elements)}/{len(_CRITICAL_ELEMENTS)} elements found")
         
         return success
         
@@ -155,17 +204,23 @@ def test_class_structure():
         print(f"❌ Class structure test failed: {e}")
         return False
 
-def test_cache_decorator_usage():
+def test_cache_decorator_usage(tree=_TREE):
     """Test that cache decorators are properly used."""
     try:
-        with open('src/codenav/universal_parser.py', 'r') as f:
-            source = f.read()
-        
-        import re
-        
-        # Find all @cached_method decorators with TTL
-        cached_method_pattern = r'@cached_method\([^)]*ttl=(\d+)[^)]*\)'
-        matches = re.findall(cached_method_pattern, source)
+        # Read the ttl= keyword of every @cached_method(...) decorator off the parsed tree
+        matches = [
+            keyword.value.value
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            for decorator in node.decorator_list
+            if isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Name)
+            and decorator.func.id == "cached_method"
+            for keyword in decorator.keywords
+            if keyword.arg == "ttl"
+            and isinstance(keyword.value, ast.Constant)
+            and isinstance(keyword.value.value, int)
+        ]
         
         print(f"   📊 Found {len(matches)} @cached_method decorators with TTL")
         
@@ -173,7 +228,7 @@ def test_cache_decorator_usage():
             print("   ✅ Sufficient cache decorators found")
             
             # Check TTL values are reasonable
-            ttl_values = [int(ttl) for ttl in matches]
+            ttl_values = matches
             reasonable_ttls = [ttl for ttl in ttl_values if 1800 <= ttl <= 86400]  # 30min to 24hr
             
             if len(reasonable_ttls) >= len(ttl_values) // 2:
@@ -190,31 +245,21 @@ def test_cache_decorator_usage():
         print(f"❌ Cache decorator test failed: {e}")
         return False
 
-def test_performance_critical_paths():
+def test_performance_critical_paths(source=_SRC):
     """Test that performance critical code paths are optimized."""
     try:
-        with open('src/codenav/universal_parser.py', 'r') as f:
-            source = f.read()
-        
-        # Check for performance optimization patterns
-        performance_patterns = [
-            ("self._gitignore_patterns is not None", "Gitignore pattern caching check"),
-            ("self._project_root == project_root", "Project root caching check"),
-            ("if self._gitignore_compiled:", "Pathspec optimization usage"),
-            ("except ImportError:", "Graceful pathspec fallback"),
-            ("fnmatch.fnmatch(", "Fallback pattern matching"),
-        ]
+        hits = _marker_hits(source)
         
         found_patterns = []
-        for pattern, description in performance_patterns:
-            if pattern in source:
+        for pattern, description in _PERFORMANCE_PATTERNS:
+            if pattern in hits:
                 found_patterns.append(description)
                 print(f"   ✅ Found: {description}")
             else:
                 print(f"   ⚠️  Missing: {description}")
         
         success = len(found_patterns) >= 3  # At least 3 critical patterns
-        print(f"   📊 Performance patterns: {len(found_patterns)}/{len(performance_patterns)} found")
+        print(f"   📊 Performance patterns: {len(found_patterns)}/{len(_PERFORMANCE_PATTERNS)} found")
         
         return success
         
@@ -222,14 +267,21 @@ def test_performance_critical_paths():
         print(f"❌ Performance patterns test failed: {e}")
         return False
 
-def test_language_support_completeness():
+def test_language_support_completeness(tree=_TREE):
     """Test that language support is comprehensive."""
     try:
-        with open('src/codenav/universal_parser.py', 'r') as f:
-            source = f.read()
-        
-        # Count language configurations
-        language_count = source.count('LanguageConfig(')  # Each language is a LanguageConfig instance
+        # Count LanguageConfig(...) calls and collect registry keys in one structural pass
+        language_count = 0
+        registry_keys = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name) and node.func.id == "LanguageConfig":
+                    language_count += 1
+            elif isinstance(node, ast.Dict):
+                registry_keys.update(
+                    key.value for key in node.keys
+                    if isinstance(key, ast.Constant) and key.value in _KEY_LANGUAGES
+                )
         
         print(f"   📊 Found {language_count} language configurations")
         
@@ -237,11 +289,7 @@ def test_language_support_completeness():
             print("   ✅ Comprehensive language support (25+ languages)")
             
             # Check for key languages
-            key_languages = ["python", "javascript", "typescript", "java", "cpp", "rust", "go"]
-            found_languages = []
-            for lang in key_languages:
-                if f'"{lang}":' in source:
-                    found_languages.append(lang)
+            found_languages = sorted(registry_keys)
             
             print(f"   ✅ Key languages found: {found_languages}")
             return len(found_languages) >= 5
@@ -0,0 +1,80 @@
+"""
+Unit tests for the request limits in codenav.sse_server.
+
+Tool execution is replaced with a gated coroutine, so no code graph is built.
+"""
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import mcp.types as types
+import pytest
+
+from codenav.sse_server import MAX_REQUEST_BODY_BYTES, CodeGraphMCPServer
+
+
+def _call_tool_request(name):
+    return types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name, arguments={}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_body_is_rejected():
+    server = CodeGraphMCPServer(Path("."))
+    transport = httpx.ASGITransport(app=server.create_starlette_app())
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/mcp/",
+            content=b"x" * (MAX_REQUEST_BODY_BYTES + 1),
+            headers={"content-type": "application/json"},
+        )
+
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_oversized_chunked_body_is_rejected():
+    server = CodeGraphMCPServer(Path("."))
+    transport = httpx.ASGITransport(app=server.create_starlette_app())
+
+    async def chunks():
+        # No Content-Length is sent for a streamed body, so only counting catches it
+        for _ in range(MAX_REQUEST_BODY_BYTES // 65536 + 1):
+            yield b"x" * 65536
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/mcp/",
+            content=chunks(),
+            headers={"content-type": "application/json"},
+        )
+
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_beyond_limit_are_refused():
+    server = CodeGraphMCPServer(Path("."), max_concurrent_tools=2)
+    release = asyncio.Event()
+
+    async def gated_tool(name, arguments):
+        await release.wait()
+        return [types.TextContent(type="text", text="done")]
+
+    server._execute_tool = gated_tool
+    handler = server.app.request_handlers[types.CallToolRequest]
+
+    in_flight = [asyncio.create_task(handler(_call_tool_request("slow"))) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    refused = await handler(_call_tool_request("slow"))
+    assert refused.root.isError
+    assert "Server busy" in refused.root.content[0].text
+
+    release.set()
+    for result in await asyncio.gather(*in_flight):
+        assert result.root.content[0].text == "done"